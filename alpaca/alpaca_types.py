@@ -3,7 +3,7 @@ This module defines named tuples that are used to structure the information
 throughout Alpaca.
 """
 
-from collections import namedtuple
+from typing import Any, NamedTuple, Optional
 
 
 # NAMED TUPLES TO STORE PROVENANCE INFORMATION OF EACH CALL
@@ -26,22 +26,26 @@ from collections import namedtuple
 #        tracking history;
 #    `execution_id`: UUID of this function call.
 
-FunctionExecution = namedtuple('FunctionExecution', ('function',
-                                                     'input',
-                                                     'params',
-                                                     'output',
-                                                     'arg_map',
-                                                     'kwarg_map',
-                                                     'call_ast',
-                                                     'code_statement',
-                                                     'time_stamp_start',
-                                                     'time_stamp_end',
-                                                     'return_targets',
-                                                     'order',
-                                                     'execution_id')
-                               )
+class FunctionExecution(NamedTuple):
+    function: Any
+    input: dict
+    params: dict
+    output: dict
+    arg_map: list
+    kwarg_map: list
+    call_ast: Any
+    code_statement: str
+    time_stamp_start: str
+    time_stamp_end: str
+    return_targets: list
+    order: int
+    execution_id: str
 
-FunctionInfo = namedtuple('FunctionInfo', ('name', 'module', 'version',))
+
+class FunctionInfo(NamedTuple):
+    name: str
+    module: str
+    version: Optional[str]
 
 
 # NAMED TUPLE TO STORE ARGUMENTS THAT ARE CONTAINERS
@@ -52,7 +56,8 @@ FunctionInfo = namedtuple('FunctionInfo', ('name', 'module', 'version',))
 # individual `DataObject` named tuples in `Container.elements` dictionary,
 # according to their order
 
-Container = namedtuple('Container', 'elements')
+class Container(NamedTuple):
+    elements: dict
 
 
 # NAMED TUPLES TO STORE HASHES AND INFORMATION ABOUT OBJECTS
@@ -60,7 +65,15 @@ Container = namedtuple('Container', 'elements')
 # `DataObject` is for Python objects, and `File` is for files stored in
 # the disk.
 
-DataObject = namedtuple('DataObject', ('hash', 'hash_method', 'type', 'id',
-                                       'details', 'value'))
+class DataObject(NamedTuple):
+    hash: Any
+    hash_method: str
+    type: str
+    id: int
+    details: dict
+    value: Any
 
-File = namedtuple('File', ('hash', 'hash_type', 'path'))
+class File(NamedTuple):
+    hash: str
+    hash_type: str
+    path: Any
@@ -80,6 +80,11 @@ class _SourceCode(object):
             self._build_line_map(self.ast_tree, self.source_lineno,
                                  self.source_code_lines)
 
+        # Statements already fetched, by line number. As the source code is
+        # fixed for the frame, the same line (e.g., a call inside a loop) can
+        # be retrieved without processing the line map again
+        self._statement_cache = {}
+
     @staticmethod
     def _find_activate_line(full_ast, function_name):
         # This function creates an AST and finds the location of the function
@@ -182,6 +187,14 @@ class _SourceCode(object):
             The code corresponding to the full statement, or None if no
             statement was found in that line.
         """
+        if line_number in self._statement_cache:
+            return self._statement_cache[line_number]
+
+        statement = self._find_statement(line_number)
+        self._statement_cache[line_number] = statement
+        return statement
+
+    def _find_statement(self, line_number):
         # Find the start and end line of the statement identified by
         # `line_number`
         line_diff = self._statement_lines[:, 0] - line_number
@@ -26,10 +26,30 @@ method.
 """
 
 import ast
+import sys
 from alpaca.alpaca_types import FunctionExecution, FunctionInfo
 import uuid
 
 
+# Constants in the AST are `ast.Constant` nodes (`ast.Num` and `ast.Str` are
+# deprecated since Python 3.8). Before Python 3.9, the index of a subscript is
+# also wrapped inside an `ast.Index` node.
+_WRAPPED_INDEX = sys.version_info < (3, 9)
+
+
+# Reference to the `decorator.Provenance` class. The module cannot be imported
+# at load time due to circular imports, and the class is fetched on first use
+_PROVENANCE = None
+
+
+def _get_provenance():
+    global _PROVENANCE
+    if _PROVENANCE is None:
+        from alpaca.decorator import Provenance
+        _PROVENANCE = Provenance
+    return _PROVENANCE
+
+
 class _StaticRelationship(object):
     """
     Base class for relationships extracted through static code analysis.
@@ -84,6 +104,8 @@ class _StaticRelationship(object):
     the root of the relationships.
     """
 
+    __slots__ = ('parent', '_node', 'object_info', 'time_stamp')
+
     _operation = None
     _node_type = None
 
@@ -159,6 +181,8 @@ class _NameRelationship(_StaticRelationship):
     with the information from the object.
     """
 
+    __slots__ = ()
+
     _operation = 'variable'
     _node_type = ast.Name
 
@@ -182,6 +206,8 @@ class _SubscriptRelationship(_StaticRelationship):
     This represents a subscripting operation in the script.
     """
 
+    __slots__ = ('_slice',)
+
     _operation = 'subscript'
     _node_type = ast.Subscript
 
@@ -191,44 +217,26 @@ class _SubscriptRelationship(_StaticRelationship):
 
     @staticmethod
     def _get_slice(slice_node):
-        # Extracts index or slice information from an `ast.Slice` or
-        # `ast.Index` nodes that are the `slice` attribute of `ast.Subscript`.
-        # Returns the slice/index value, that will be used to fetch the
-        # actual Python object returned by the subscript operation.
+        # Extracts index or slice information from the node that is the
+        # `slice` attribute of `ast.Subscript`. Returns the slice/index value,
+        # that will be used to fetch the actual Python object returned by the
+        # subscript operation.
 
-        if isinstance(slice_node, ast.Index):
+        if _WRAPPED_INDEX and isinstance(slice_node, ast.Index):
+            # Python 3.8: index is the value of an `ast.Index` node
+            slice_node = slice_node.value
 
-            # Integer or string indexing
-            if isinstance(slice_node.value, ast.Num):
-                index_value = int(slice_node.value.n)
-            elif isinstance(slice_node.value, ast.Str):
-                index_value = slice_node.value.s
-            elif isinstance(slice_node.value, ast.Name):
-                from alpaca.decorator import Provenance
-                index_value = Provenance._get_script_variable(slice_node.value.id)
-            elif isinstance(slice_node.value, ast.UnaryOp) and \
-                isinstance(slice_node.value.op, ast.USub):
-                # Negative indexing
-                index_value = -int(slice_node.value.operand.n)
-            else:
-                raise TypeError("Operation not supported")
-
-            return index_value
-
-        # Required for newer Python versions
         if isinstance(slice_node, ast.Constant):
-            index_value = slice_node.value
-            return index_value
+            # Integer or string indexing
+            return slice_node.value
 
         if isinstance(slice_node, ast.UnaryOp) and \
                 isinstance(slice_node.op, ast.USub):
             # Negative indexing
-            return -int(slice_node.operand.n)
+            return -int(slice_node.operand.value)
 
         if isinstance(slice_node, ast.Name):
-            from alpaca.decorator import Provenance
-            index_value = Provenance._get_script_variable(slice_node.id)
-            return index_value
+            return _get_provenance()._get_script_variable(slice_node.id)
 
         if isinstance(slice_node, ast.Slice):
             # Slicing
@@ -236,9 +244,9 @@ class _SubscriptRelationship(_StaticRelationship):
             start = getattr(slice_node, 'lower', None)
             step = getattr(slice_node, 'step', None)
 
-            stop = int(stop.n) if stop is not None else None
-            start = int(start.n) if start is not None else None
-            step = int(step.n) if step is not None else None
+            stop = int(stop.value) if stop is not None else None
+            start = int(start.value) if start is not None else None
+            step = int(step.value) if step is not None else None
 
             return slice(start, stop, step)
 
@@ -273,6 +281,8 @@ class _AttributeRelationship(_StaticRelationship):
     the script.
     """
 
+    __slots__ = ()
+
     _operation = 'attribute'
     _node_type = ast.Attribute
 
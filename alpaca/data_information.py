@@ -11,7 +11,10 @@ the user, but are used internally by the `decorator.Provenance` decorator.
 
 import hashlib
 import inspect
+import mmap
+import os
 import uuid
+import weakref
 from copy import copy
 from pathlib import Path
 import logging
@@ -23,6 +26,12 @@ import numpy as np
 from numbers import Number
 from dill._dill import save_function
 
+try:
+    import xxhash
+    _HAS_XXHASH = True
+except ImportError:
+    _HAS_XXHASH = False
+
 from alpaca.alpaca_types import DataObject, File
 from alpaca.ontology.annotation import _OntologyInformation, ONTOLOGY_INFORMATION
 
@@ -44,6 +53,43 @@ logger.addHandler(log_handler)
 logger.propagate = False
 
 
+# Classes whose objects have no ontology annotations, so that the
+# `__ontology__` attribute is not looked up again for every object of these
+# classes. Only classes whose instances cannot carry their own annotation
+# (see `_is_annotation_per_type`) are stored
+_NON_ANNOTATED_TYPES = weakref.WeakSet()
+
+
+def _is_annotation_per_type(obj):
+    # Returns True if the ontology annotation of `obj` can only come from
+    # its class. This is the case if the class does not define the attributes
+    # looked up for annotations nor `__getattr__`, and if the instances have
+    # no `__dict__` where the attributes could be set (e.g., functions)
+    obj_class = type(obj)
+    return not (hasattr(obj, '__dict__') or
+                hasattr(obj_class, '__ontology__') or
+                hasattr(obj_class, '__wrapped__') or
+                hasattr(obj_class, '__getattr__'))
+
+
+# `hashlib.file_digest` is available from Python 3.11
+_HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+
+
+def _joblib_hash(obj, hash_algorithm):
+    # `joblib.hash` accepts only the algorithms in `hashlib`. For xxHash, the
+    # hash object of joblib's hasher is replaced, so that objects are
+    # serialized the same way regardless of the algorithm
+    if hash_algorithm == 'xxh128':
+        if not _HAS_XXHASH:
+            raise ValueError("The 'xxhash' package is required to hash "
+                             "objects with the 'xxh128' algorithm")
+        hasher = joblib.hashing.NumpyHasher()
+        hasher._hash = xxhash.xxh128()
+        return hasher.hash(obj)
+    return joblib.hash(obj, hash_name=hash_algorithm)
+
+
 class _FileInformation(object):
     """
     Class for getting information from files.
@@ -62,12 +108,27 @@ class _FileInformation(object):
     """
 
     @staticmethod
-    def _get_content_file_hash(file_path, block_size=4096 * 1024):
-        file_hash = hashlib.sha256()
-
+    def _get_content_file_hash(file_path, block_size=4096 * 1024,
+                               mmap_threshold=64 * 1024 * 1024):
         with open(file_path, 'rb') as file:
-            for block in iter(lambda: file.read(block_size), b""):
-                file_hash.update(block)
+            if os.fstat(file.fileno()).st_size > mmap_threshold:
+                # Large files are memory-mapped and hashed as a single buffer
+                try:
+                    with mmap.mmap(file.fileno(), 0,
+                                   access=mmap.ACCESS_READ) as mapped_file:
+                        return hashlib.sha256(mapped_file).hexdigest()
+                except (OSError, ValueError):
+                    # The file could not be mapped (e.g., file larger than
+                    # the address space). Read the file instead.
+                    pass
+
+            if _HAS_FILE_DIGEST:
+                # Python 3.11+: the file is read and hashed in C
+                file_hash = hashlib.file_digest(file, 'sha256')
+            else:
+                file_hash = hashlib.sha256()
+                for block in iter(lambda: file.read(block_size), b""):
+                    file_hash.update(block)
 
         return file_hash.hexdigest()
 
@@ -112,7 +173,8 @@ class _ObjectInformation(object):
     Class for hashing Python objects and getting their information, supporting
     memoization.
 
-    The object hash is the SHA1 hash of its value.
+    The object hash is the SHA1 (or MD5 or xxHash, according to the
+    `hash_algorithm` parameter) hash of its value.
 
     The type is a string produced by the combination of the module where it
     was defined plus the type name (both returned by :func:`type`).
@@ -147,6 +209,10 @@ class _ObjectInformation(object):
         the NumPy numeric types (e.g., `np.float64`). The values of these are
         always stored.
         Default: None
+    hash_algorithm : {'sha1', 'md5', 'xxh128'}, optional
+        Algorithm used by :func:`joblib.hash` to compute the object hashes.
+        The 'xxh128' algorithm requires the `xxhash` package.
+        Default: 'sha1'
     """
 
     # This is a list of object attributes that provide relevant provenance
@@ -155,12 +221,20 @@ class _ObjectInformation(object):
                             'id', 'nix_name', 'dimensionality', 'pid',
                             'create_time')
 
-    def __init__(self, use_builtin_hash=None, store_values=None):
+    __slots__ = ('_hash_memoizer', '_hash_algorithm', '_joblib_hash_method',
+                 '_use_builtin_hash', '_store_values')
+
+    def __init__(self, use_builtin_hash=None, store_values=None,
+                 hash_algorithm='sha1'):
         self._hash_memoizer = dict()
-        self._use_builtin_hash = copy(use_builtin_hash) \
-            if use_builtin_hash is not None else []
-        self._store_values = copy(store_values)\
-            if store_values is not None else []
+        self._hash_algorithm = hash_algorithm
+        self._joblib_hash_method = f"joblib_{hash_algorithm.upper()}"
+        # Snapshots of the lists are stored as sets, as membership is
+        # checked for every object
+        self._use_builtin_hash = frozenset(use_builtin_hash) \
+            if use_builtin_hash is not None else frozenset()
+        self._store_values = frozenset(store_values) \
+            if store_values is not None else frozenset()
 
     @staticmethod
     def _get_object_package(obj):
@@ -181,8 +255,9 @@ class _ObjectInformation(object):
 
         # If we already computed the hash for the object during this function
         # call, retrieve it from the memoized values
-        if obj_id in self._hash_memoizer:
-            return self._hash_memoizer[obj_id]
+        memoized = self._hash_memoizer.get(obj_id)
+        if memoized is not None:
+            return memoized
 
         logger.debug("Hashing")
 
@@ -224,16 +299,18 @@ class _ObjectInformation(object):
 
                 iterator = obj if not isinstance(obj, np.ndarray) \
                     else obj.ravel()
-                object_hash = joblib.hash(
+                object_hash = _joblib_hash(
                     tuple([hash(element) for element in iterator]),
-                    hash_name='sha1'
+                    self._hash_algorithm
                 )
                 hash_method = "Python_hash"
             else:
                 # Other objects, like Neo, Quantity and NumPy arrays, use
-                # joblib's hash function
-                object_hash = joblib.hash(obj, hash_name='sha1')
-                hash_method = "joblib_SHA1"
+                # joblib's hash function. The buffers of NumPy arrays are
+                # passed directly to the hash object, without pickling the
+                # data. Only dtype, shape and strides are pickled
+                object_hash = _joblib_hash(obj, self._hash_algorithm)
+                hash_method = self._joblib_hash_method
 
         # Memoize the hash
         self._hash_memoizer[obj_id] = (object_hash, hash_method)
@@ -263,7 +340,8 @@ class _ObjectInformation(object):
             * hash : str or UUID
                 Hash of the object. For None objects, it will be an UUID
                 generated to uniquely identify the object.
-            * hash_method : {"Python_hash", "joblib_SHA1", "UUID"}
+            * hash_method : {"Python_hash", "joblib_SHA1", "joblib_MD5",
+                             "joblib_XXH128", "UUID"}
                 Hash function used in the computation. If the
                 :attr:`use_builtin_hash` list is defined, the builtin Python
                 `hash` function is used for objects of the packages in the
@@ -322,8 +400,11 @@ class _ObjectInformation(object):
 
         # Add ontology information if not present
         if (not ONTOLOGY_INFORMATION.get(obj_type) and
-            _OntologyInformation.get_ontology_information(obj)):
-            ONTOLOGY_INFORMATION[obj_type] = _OntologyInformation(obj)
+                type_information not in _NON_ANNOTATED_TYPES):
+            if _OntologyInformation.get_ontology_information(obj):
+                ONTOLOGY_INFORMATION[obj_type] = _OntologyInformation(obj)
+            elif _is_annotation_per_type(obj):
+                _NON_ANNOTATED_TYPES.add(type_information)
 
         return DataObject(hash=obj_hash, hash_method=hash_method,
                           type=obj_type, id=obj_id, details=details,
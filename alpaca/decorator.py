@@ -22,7 +22,7 @@ from alpaca.code_analysis.source_code import _SourceCode
 from alpaca.serialization import AlpacaProvDocument
 from alpaca.serialization.identifiers import _get_function_name
 from alpaca.utils.files import RDF_FILE_FORMAT_MAP
-from alpaca.settings import _ALPACA_SETTINGS
+from alpaca.settings import _get_setting
 from alpaca.ontology.annotation import _OntologyInformation, ONTOLOGY_INFORMATION
 
 from pprint import pprint
@@ -433,7 +433,7 @@ class Provenance(object):
 
     def _capture_input_and_parameters_provenance(self, function, args, kwargs,
         ast_tree, function_info, time_stamp_start, builtin_object_hash,
-        store_values):
+        store_values, hash_algorithm):
 
         # 1. Extract the parameters passed to the function and store them in
         # the `input_data` dictionary.
@@ -458,7 +458,8 @@ class Provenance(object):
         # are going to be stored in the dictionary `inputs`.
 
         data_info = _ObjectInformation(use_builtin_hash=builtin_object_hash,
-                                       store_values=store_values)
+                                       store_values=store_values,
+                                       hash_algorithm=hash_algorithm)
 
         # Initialize parameter list with all default arguments that were not
         # passed to the function
@@ -588,12 +589,14 @@ class Provenance(object):
     def _capture_output_provenance(self, function_output, return_targets,
                                    input_data, builtin_object_hash,
                                    time_stamp_start, execution_id,
-                                   store_values, constructed_object=None):
+                                   store_values, hash_algorithm,
+                                   constructed_object=None):
 
         # In case in-place operations were performed, lets not use
         # memoization
         data_info = _ObjectInformation(use_builtin_hash=builtin_object_hash,
-                                       store_values=store_values)
+                                       store_values=store_values,
+                                       hash_algorithm=hash_algorithm)
 
         # 6. Create hash for the output using `_ObjectInformation` to follow
         # individual returns. The hashes will be stored in the `outputs`
@@ -637,9 +640,9 @@ class Provenance(object):
         @wraps(function)
         def wrapped(*args, **kwargs):
 
-            builtin_object_hash = _ALPACA_SETTINGS[
-                'use_builtin_hash_for_module']
-            store_values = _ALPACA_SETTINGS['store_values']
+            builtin_object_hash = _get_setting('use_builtin_hash_for_module')
+            store_values = _get_setting('store_values')
+            hash_algorithm = _get_setting('object_hash_algorithm')
             logging.debug(f"Builtin object hash: {builtin_object_hash}")
 
             lineno = None
@@ -682,7 +685,8 @@ class Provenance(object):
                                 ast_tree=ast_tree, function_info=function_info,
                                 time_stamp_start=time_stamp_start,
                                 builtin_object_hash=builtin_object_hash,
-                                store_values=store_values)
+                                store_values=store_values,
+                                hash_algorithm=hash_algorithm)
 
             # Call the function
             function_output = function(*args, **kwargs)
@@ -710,6 +714,7 @@ class Provenance(object):
                     time_stamp_start=time_stamp_start,
                     execution_id=execution_id,
                     store_values=store_values,
+                    hash_algorithm=hash_algorithm,
                     constructed_object=constructed_object)
 
                 # Get the end time stamp
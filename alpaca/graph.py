@@ -92,8 +92,8 @@ def _add_attribute(data, attr_name, attr_type, attr_value, strip_namespace):
 
 def _get_name_value_pair(graph, bnode):
     # Read name and value from the NameValuePair blank node
-    attr_name = str(list(graph.objects(bnode, ALPACA.pairName))[0])
-    attr_value = str(list(graph.objects(bnode, ALPACA.pairValue))[0])
+    attr_name = str(next(graph.objects(bnode, ALPACA.pairName)))
+    attr_value = str(next(graph.objects(bnode, ALPACA.pairValue)))
     return attr_name, attr_value
 
 
@@ -125,7 +125,7 @@ def _get_entity_data(graph, entity, annotations=None, attributes=None,
             data[value_attribute] = value.toPython()
 
     if data['type'] == NSS_FILE:
-        file_path = str(list(graph.objects(entity, ALPACA.filePath))[0])
+        file_path = str(next(graph.objects(entity, ALPACA.filePath)))
         data["File_path"] = file_path
 
     return data
@@ -378,15 +378,15 @@ class ProvenanceGraph:
                 params[name] = value
 
             # Execution order
-            execution_order = list(
+            execution_order = next(
                 graph.objects(func_execution,
-                              ALPACA.executionOrder))[0].value
+                              ALPACA.executionOrder)).value
 
             # Function description
-            function = list(
-                graph.objects(func_execution, ALPACA.usedFunction))[0]
-            function_name = list(
-                graph.objects(function, ALPACA.functionName))[0].value
+            function = next(
+                graph.objects(func_execution, ALPACA.usedFunction))
+            function_name = next(
+                graph.objects(function, ALPACA.functionName)).value
 
             # Get the entity(ies) used for this generation
             source_entities = list()
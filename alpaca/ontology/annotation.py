@@ -150,11 +150,21 @@ VALID_INFORMATION = {
 }
 VALID_OBJECTS = set(VALID_INFORMATION.keys())
 
+# Additional information that is stored for functions or data objects.
+# Namespaces are handled separately
+_SPECIFIC_INFORMATION = \
+    set().union(*VALID_INFORMATION.values()) - {'namespaces'}
+
 
 # Global dictionary to store ontology information during the capture.
 # This is used later for the serialization.
 ONTOLOGY_INFORMATION = {}
 
+# `rdflib.Namespace` objects by URI, shared by all prefixes defined with the
+# same URI. Clearing the namespaces of `_OntologyInformation` does not remove
+# them
+_NAMESPACES_BY_URI = {}
+
 
 class _OntologyInformation(object):
     """
@@ -178,6 +188,12 @@ class _OntologyInformation(object):
 
     namespaces = {}
 
+    # One slot per annotation that can be stored in `__ontology__`, except
+    # namespaces that are shared by the class. Annotations not defined for
+    # the object are not set, and `has_information` will be False
+    __slots__ = tuple(sorted(VALID_OBJECTS | _SPECIFIC_INFORMATION)) + \
+        ('_uri_cache',)
+
     @classmethod
     def add_namespace(cls, name, uri):
         if name in cls.namespaces:
@@ -186,7 +202,11 @@ class _OntologyInformation(object):
                                  "namespace. This is not allowed as other "
                                  "terms expect a different URI.")
         else:
-            cls.namespaces[name] = rdflib.Namespace(uri)
+            namespace = _NAMESPACES_BY_URI.get(uri)
+            if namespace is None:
+                namespace = rdflib.Namespace(uri)
+                _NAMESPACES_BY_URI[uri] = namespace
+            cls.namespaces[name] = namespace
 
     @classmethod
     def bind_namespaces(cls, namespace_manager):
@@ -204,6 +224,9 @@ class _OntologyInformation(object):
 
     def __init__(self, obj):
 
+        # Stores the URIs already resolved by `get_uri`
+        self._uri_cache = {}
+
         ontology_info = self.get_ontology_information(obj)
         if ontology_info:
             # An ontology annotation with semantic information is present
@@ -217,7 +240,7 @@ class _OntologyInformation(object):
                     # Add all namespaces, checking for inconsistencies
                     for prefix, uri in information.items():
                         self.add_namespace(prefix, uri)
-                else:
+                elif information_type in _SPECIFIC_INFORMATION:
                     # Add additional information on the function or data
                     # object
                     setattr(self, information_type, deepcopy(information))
@@ -233,6 +256,16 @@ class _OntologyInformation(object):
         return None
 
     def get_uri(self, information_type, element=None):
+        # The URIs of an annotation are requested for every function
+        # execution or data object that is serialized. They are resolved only
+        # once
+        key = (information_type, element)
+        if key not in self._uri_cache:
+            self._uri_cache[key] = self._resolve_uri(information_type,
+                                                     element)
+        return self._uri_cache[key]
+
+    def _resolve_uri(self, information_type, element):
         if information_type in VALID_OBJECTS:
             # Information on 'function' and 'data_object' are strings or
             # lists, stored directly as attributes
@@ -23,6 +23,11 @@ TYPES_MAP = {
 }
 
 
+# Base types are returned unchanged. Exact types are checked first, as they
+# are the most common values (e.g., function parameters)
+BASE_TYPES = frozenset((int, str, bool, float))
+
+
 PACKAGES_MAP = {
     'neo': _neo_to_prov,
     'quantities': _quantity_to_prov,
@@ -37,6 +42,9 @@ def _ensure_type(value):
     # converted, as they are already supported.
 
     value_type = type(value)
+    if value_type in BASE_TYPES:
+        return value
+
     package = value_type.__module__.split(".")[0]
 
     if package in PACKAGES_MAP:
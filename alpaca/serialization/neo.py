@@ -14,7 +14,8 @@ A special converter for attribute values is also provided, so that they can
 be properly serialized to strings.
 """
 
-from alpaca.ontology import ALPACA
+from alpaca.serialization.terms import (ALPACA_HAS_ANNOTATION,
+                                        ALPACA_HAS_ATTRIBUTE)
 
 
 __all__ = ['_neo_to_prov', '_neo_object_metadata']
@@ -50,10 +51,13 @@ def _neo_to_prov(value, displayed_attributes=DISPLAYED_ATTRIBUTES):
     return neo_repr
 
 
-def _neo_object_metadata(graph, uri, metadata):
+def _neo_object_metadata(graph, uri, metadata, quads, new_blank_node):
     # Adds metadata of a Neo object to an entity in the RDF graph `graph`.
     # `uri` is the identifier of the object in the graph, and `metadata` is
-    # the dictionary of object metadata captured by Alpaca.
+    # the dictionary of object metadata captured by Alpaca. The triples are
+    # not inserted in `graph`, but appended as quads to the `quads` list, to
+    # be added by the caller in a single operation. `new_blank_node` is a
+    # callable returning the blank node for each attribute/annotation.
     # Returns a dictionary of attribute/annotation names with blank node
     # URIs, that are used later for inserting semantic information if
     # ontology annotations are defined.
@@ -83,11 +87,12 @@ def _neo_object_metadata(graph, uri, metadata):
                 attr_value = _neo_to_prov(value)
 
             # Add the attribute relationship to the object Entity
-            blank_node = _add_name_value_pair(graph,
+            blank_node = _add_name_value_pair(quads, graph,
                                               uri=uri,
-                                              predicate=ALPACA.hasAttribute,
+                                              predicate=ALPACA_HAS_ATTRIBUTE,
                                               name=name,
-                                              value=attr_value)
+                                              value=attr_value,
+                                              blank_node=new_blank_node())
             metadata_nodes['attributes'][name] = blank_node
 
         elif name in ('annotations', 'array_annotations') and \
@@ -100,11 +105,12 @@ def _neo_object_metadata(graph, uri, metadata):
                 annotation_value = _ensure_type(annotation_value)
 
                 # Add the annotation relationship
-                blank_node = _add_name_value_pair(graph,
+                blank_node = _add_name_value_pair(quads, graph,
                                             uri=uri,
-                                            predicate=ALPACA.hasAnnotation,
+                                            predicate=ALPACA_HAS_ANNOTATION,
                                             name=annotation,
-                                            value=annotation_value)
+                                            value=annotation_value,
+                                            blank_node=new_blank_node())
                 metadata_nodes['annotations'][name] = blank_node
 
         else:
@@ -112,11 +118,12 @@ def _neo_object_metadata(graph, uri, metadata):
             value = _ensure_type(value)
 
             # Add attribute relationship
-            blank_node = _add_name_value_pair(graph,
+            blank_node = _add_name_value_pair(quads, graph,
                                               uri=uri,
-                                              predicate=ALPACA.hasAttribute,
+                                              predicate=ALPACA_HAS_ATTRIBUTE,
                                               name=name,
-                                              value=value)
+                                              value=value,
+                                              blank_node=new_blank_node())
             metadata_nodes['attributes'][name] = blank_node
 
     return metadata_nodes
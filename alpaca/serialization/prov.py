@@ -9,14 +9,40 @@ RDF files.
 
 """
 
-from itertools import product, chain
+from itertools import product, chain, count
+import uuid
 import numpy as np
 import numbers
 
 from rdflib import Graph, URIRef, BNode, Literal
-from rdflib.namespace import RDF, PROV, XSD
+from rdflib.namespace import PROV, XSD
 
 from alpaca.ontology import ALPACA
+from alpaca.serialization.terms import (ALPACA_CODE_STATEMENT,
+                                        ALPACA_CONTAINER_INDEX,
+                                        ALPACA_CONTAINER_SLICE,
+                                        ALPACA_DATA_OBJECT_ENTITY,
+                                        ALPACA_EXECUTION_ORDER,
+                                        ALPACA_FILE_ENTITY, ALPACA_FILE_PATH,
+                                        ALPACA_FROM_ATTRIBUTE, ALPACA_FUNCTION,
+                                        ALPACA_FUNCTION_EXECUTION,
+                                        ALPACA_FUNCTION_NAME,
+                                        ALPACA_FUNCTION_VERSION,
+                                        ALPACA_HASH_SOURCE,
+                                        ALPACA_HAS_ATTRIBUTE,
+                                        ALPACA_HAS_PARAMETER,
+                                        ALPACA_IMPLEMENTED_IN,
+                                        ALPACA_NAME_VALUE_PAIR,
+                                        ALPACA_PAIR_NAME, ALPACA_PAIR_VALUE,
+                                        ALPACA_SCRIPT_AGENT,
+                                        ALPACA_SCRIPT_PATH,
+                                        ALPACA_USED_FUNCTION,
+                                        PROV_ENDED_AT_TIME, PROV_HAD_MEMBER,
+                                        PROV_STARTED_AT_TIME, PROV_USED,
+                                        PROV_VALUE, PROV_WAS_ASSOCIATED_WITH,
+                                        PROV_WAS_ATTRIBUTED_TO,
+                                        PROV_WAS_DERIVED_FROM,
+                                        PROV_WAS_GENERATED_BY, RDF_TYPE)
 from alpaca.serialization.identifiers import (data_object_identifier,
                                               file_identifier,
                                               function_identifier,
@@ -28,23 +54,44 @@ from alpaca.serialization.neo import _neo_object_metadata
 
 from alpaca.utils.files import _get_prov_file_format
 from alpaca.alpaca_types import DataObject, File, Container
-from alpaca.settings import _ALPACA_SETTINGS
+from alpaca.settings import _get_setting
 from alpaca.ontology.annotation import _OntologyInformation, ONTOLOGY_INFORMATION
 
 from tqdm import tqdm
 
 
-def _add_name_value_pair(graph, uri, predicate, name, value):
-    # Add a relationship defined by `predicate` using a blank node as object.
+# Names of the operations in the history that describe membership
+# relationships (attribute access and subscripting)
+MEMBERSHIP_OPERATIONS = ("attribute", "subscript")
+
+
+def _add_name_value_pair(quads, graph, uri, predicate, name, value,
+                         blank_node):
+    # Add a relationship defined by `predicate` using `blank_node` as object.
     # The object will be of type `alpaca:NameValuePair`.
-    blank_node = BNode()
-    graph.add((uri, predicate, blank_node))
-    graph.add((blank_node, RDF.type, ALPACA.NameValuePair))
-    graph.add((blank_node, ALPACA.pairName, Literal(name)))
-    graph.add((blank_node, ALPACA.pairValue, Literal(value)))
+    # The triples are not added directly to `graph`, but appended as quads
+    # to the `quads` list, so that they can be inserted in a single
+    # `graph.addN` call.
+    quads.append((uri, predicate, blank_node, graph))
+    quads.append((blank_node, RDF_TYPE, ALPACA_NAME_VALUE_PAIR, graph))
+    quads.append((blank_node, ALPACA_PAIR_NAME, Literal(name), graph))
+    quads.append((blank_node, ALPACA_PAIR_VALUE, Literal(value), graph))
     return blank_node
 
 
+# Top-level package of each object type string. The same types are repeated
+# for every object in the history, so each string is split only once
+_PACKAGE_NAMES = {}
+
+
+def _get_package_name(type_string):
+    package_name = _PACKAGE_NAMES.get(type_string)
+    if package_name is None:
+        package_name = type_string.partition(".")[0]
+        _PACKAGE_NAMES[type_string] = package_name
+    return package_name
+
+
 class AlpacaProvDocument(object):
     """
     Generates a file using the Alpaca ontology (based on W3C PROV-O) from
@@ -78,7 +125,18 @@ class AlpacaProvDocument(object):
         namespace_manager = self.graph.namespace_manager
         namespace_manager.bind('alpaca', ALPACA)
         namespace_manager.bind('prov', PROV)
-        self._authority = _ALPACA_SETTINGS['authority']
+        self._authority = _get_setting('authority')
+
+        # Snapshot of the types whose values are stored, as this is checked
+        # for every entity
+        self._store_values = frozenset(_get_setting('store_values'))
+
+        # All blank nodes are identified by a single counter, instead of the
+        # default `BNode` identifiers that require one UUID per node. The
+        # random prefix avoids collisions if graphs from several documents are
+        # merged.
+        self._bnode_prefix = f"b{uuid.uuid4().hex[:8]}"
+        self._bnode_seq = count()
 
         # Gets all OntologyInformation objects generated with annotation
         # information during the run. Update the current graph namespaces
@@ -88,7 +146,9 @@ class AlpacaProvDocument(object):
         # Metadata plugins are used for packages (e.g., Neo) that require
         # special handling of metadata when adding to the PROV records.
         # Plugins are external functions that take the graph, the object URI,
-        # and the metadata dict as parameters. The function should return a
+        # the metadata dict, a list where the quads to be added to the graph
+        # are appended, and a callable that generates the blank nodes
+        # (`new_blank_node`) as parameters. The function should return a
         # dictionary mapping all blank nodes generated to represent attributes
         # and annotations, to allow the use of any semantic information
         # defined by ontology annotations (i.e., __ontology__ attribute).
@@ -100,6 +160,15 @@ class AlpacaProvDocument(object):
         # there is a fast lookup
         self._entity_uris = set()
 
+        # URIs of the entities, by the information used in the identifiers.
+        # The same object is usually referenced by several records in the
+        # history, so the identifiers are built only once
+        self._entity_uri_cache = {}
+
+        # Set to store the membership relationships already added to the
+        # graph, to skip repeated records
+        self._memberships = set()
+
         # Store functions that have container output ontology annotations,
         # To add the identification to the objects after the graph is built
         self._container_output_functions = {}
@@ -108,22 +177,26 @@ class AlpacaProvDocument(object):
             if container_returns:
                 self._container_output_functions[obj_type] = container_returns
 
+    def _new_blank_node(self):
+        # Short identifiers, with the counter in hexadecimal
+        return BNode(f"{self._bnode_prefix}{next(self._bnode_seq):x}")
+
     # PROV relationships methods
 
     def _wasAttributedTo(self, entity, agent):
-        self.graph.add((entity, PROV.wasAttributedTo, agent))
+        self.graph.add((entity, PROV_WAS_ATTRIBUTED_TO, agent))
 
     def _wasAssociatedWith(self, activity, agent):
-        self.graph.add((activity, PROV.wasAssociatedWith, agent))
+        self.graph.add((activity, PROV_WAS_ASSOCIATED_WITH, agent))
 
     def _wasDerivedFrom(self, used_entity, generated_entity):
-        self.graph.add((generated_entity, PROV.wasDerivedFrom, used_entity))
+        self.graph.add((generated_entity, PROV_WAS_DERIVED_FROM, used_entity))
 
     def _wasGeneratedBy(self, entity, activity):
-        self.graph.add((entity, PROV.wasGeneratedBy, activity))
+        self.graph.add((entity, PROV_WAS_GENERATED_BY, activity))
 
     def _used(self, activity, entity):
-        self.graph.add((activity, PROV.used, entity))
+        self.graph.add((activity, PROV_USED, entity))
 
     # Agent methods
 
@@ -131,8 +204,8 @@ class AlpacaProvDocument(object):
         # Adds a ScriptAgent record from the Alpaca PROV model
         uri = URIRef(script_identifier(script_info, session_id,
                                        self._authority))
-        self.graph.add((uri, RDF.type, ALPACA.ScriptAgent))
-        self.graph.add((uri, ALPACA.scriptPath, Literal(script_info.path)))
+        self.graph.add((uri, RDF_TYPE, ALPACA_SCRIPT_AGENT))
+        self.graph.add((uri, ALPACA_SCRIPT_PATH, Literal(script_info.path)))
         return uri
 
     # Activity methods
@@ -140,12 +213,12 @@ class AlpacaProvDocument(object):
     def _add_Function(self, function_info):
         # Adds a Function record from the Alpaca PROV model
         uri = URIRef(function_identifier(function_info, self._authority))
-        self.graph.add((uri, RDF.type, ALPACA.Function))
-        self.graph.add((uri, ALPACA.functionName,
+        self.graph.add((uri, RDF_TYPE, ALPACA_FUNCTION))
+        self.graph.add((uri, ALPACA_FUNCTION_NAME,
                         Literal(function_info.name)))
-        self.graph.add((uri, ALPACA.implementedIn,
+        self.graph.add((uri, ALPACA_IMPLEMENTED_IN,
                         Literal(function_info.module)))
-        self.graph.add((uri, ALPACA.functionVersion,
+        self.graph.add((uri, ALPACA_FUNCTION_VERSION,
                         Literal(function_info.version)))
         return uri
 
@@ -155,9 +228,9 @@ class AlpacaProvDocument(object):
         if class_info:
             if isinstance(class_info, list):
                 for class_uri in class_info:
-                    self.graph.add((target_uri, RDF.type, class_uri))
+                    self.graph.add((target_uri, RDF_TYPE, class_uri))
             else:
-                self.graph.add((target_uri, RDF.type, class_info))
+                self.graph.add((target_uri, RDF_TYPE, class_info))
 
     def _add_FunctionExecution(self, script_info, session_id, execution_id,
                                function_info, params, execution_order,
@@ -167,34 +240,56 @@ class AlpacaProvDocument(object):
         uri = URIRef(execution_identifier(
             script_info, function_info, session_id, execution_id,
             self._authority))
-        self.graph.add((uri, RDF.type, ALPACA.FunctionExecution))
+        self.graph.add((uri, RDF_TYPE, ALPACA_FUNCTION_EXECUTION))
 
         if ontology_info:
             self._add_ontology_information(uri, ontology_info, 'function')
 
-        self.graph.add((uri, PROV.startedAtTime,
+        self.graph.add((uri, PROV_STARTED_AT_TIME,
                         Literal(start, datatype=XSD.dateTime)))
-        self.graph.add((uri, PROV.endedAtTime,
+        self.graph.add((uri, PROV_ENDED_AT_TIME,
                         Literal(end, datatype=XSD.dateTime)))
-        self.graph.add((uri, ALPACA.codeStatement, Literal(code_statement)))
-        self.graph.add((uri, ALPACA.executionOrder,
+        self.graph.add((uri, ALPACA_CODE_STATEMENT, Literal(code_statement)))
+        self.graph.add((uri, ALPACA_EXECUTION_ORDER,
                         Literal(execution_order, datatype=XSD.integer)))
-        self.graph.add((uri, ALPACA.usedFunction, function))
+        self.graph.add((uri, ALPACA_USED_FUNCTION, function))
+
+        if not params:
+            return uri
 
+        quads = []
         for name, value in params.items():
             value = _ensure_type(value)
-            parameter_node = _add_name_value_pair(self.graph, uri,
-                                                  ALPACA.hasParameter,
-                                                  name, value)
+            parameter_node = _add_name_value_pair(
+                quads, self.graph, uri, ALPACA_HAS_PARAMETER, name, value,
+                blank_node=self._new_blank_node())
             if ontology_info:
                 self._add_ontology_information(parameter_node,
                                                ontology_info, 'arguments',
                                                name)
+        self.graph.addN(quads)
         return uri
 
     # Entity methods
-    @classmethod
-    def _get_entity_value_datatype(cls, info):
+
+    def _get_entity_uri(self, info):
+        # Returns the `URIRef` identifying the entity described by the
+        # `DataObject` or `File` named tuple `info`
+        if isinstance(info, DataObject):
+            key = (DataObject, info.type, info.hash)
+        else:
+            key = (File, info.hash_type, info.hash)
+
+        uri = self._entity_uri_cache.get(key)
+        if uri is None:
+            identifier = data_object_identifier(info, self._authority) \
+                if key[0] is DataObject else \
+                file_identifier(info, self._authority)
+            uri = URIRef(identifier)
+            self._entity_uri_cache[key] = uri
+        return uri
+
+    def _get_entity_value_datatype(self, info):
         value = info.value
         if value is None:
             return None
@@ -202,18 +297,18 @@ class AlpacaProvDocument(object):
         # Check if builtin type or NumPy dtype
         value_class = value.__class__ if not isinstance(value, np.number) \
             else value.dtype.type
-        if value_class in cls.XSD_TYPES:
-            return cls.XSD_TYPES[value_class]
+        if value_class in self.XSD_TYPES:
+            return self.XSD_TYPES[value_class]
 
         # Check if object is include in the `store_values` setting.
         # In this case, they are always stored as strings
         obj_type = info.type
-        if obj_type in _ALPACA_SETTINGS['store_values']:
+        if obj_type in self._store_values:
             return XSD.string
 
         for possible_type in (numbers.Integral, numbers.Real, numbers.Complex):
             if issubclass(value_class, possible_type):
-                return cls.XSD_TYPES[possible_type]
+                return self.XSD_TYPES[possible_type]
 
         # Type not found
         return None
@@ -221,17 +316,17 @@ class AlpacaProvDocument(object):
     def _add_DataObjectEntity(self, info):
         # Adds a DataObjectEntity from the Alpaca PROV model
         # If the entity already exists, skip it
-        uri = URIRef(data_object_identifier(info, self._authority))
+        uri = self._get_entity_uri(info)
 
         if uri in self._entity_uris:
             return uri
 
-        self.graph.add((uri, RDF.type, ALPACA.DataObjectEntity))
-        self.graph.add((uri, ALPACA.hashSource, Literal(info.hash_method)))
+        self.graph.add((uri, RDF_TYPE, ALPACA_DATA_OBJECT_ENTITY))
+        self.graph.add((uri, ALPACA_HASH_SOURCE, Literal(info.hash_method)))
 
         value_datatype = self._get_entity_value_datatype(info)
         if value_datatype:
-            self.graph.add((uri, PROV.value,
+            self.graph.add((uri, PROV_VALUE,
                             Literal(info.value, datatype=value_datatype)))
 
         ontology_info = ONTOLOGY_INFORMATION.get(info.type, None)
@@ -244,23 +339,30 @@ class AlpacaProvDocument(object):
 
     def _add_FileEntity(self, info):
         # Adds a FileEntity from the Alpaca PROV model
-        uri = URIRef(file_identifier(info, self._authority))
-        self.graph.add((uri, RDF.type, ALPACA.FileEntity))
-        self.graph.add((uri, ALPACA.filePath,
+        uri = self._get_entity_uri(info)
+        self.graph.add((uri, RDF_TYPE, ALPACA_FILE_ENTITY))
+        self.graph.add((uri, ALPACA_FILE_PATH,
                         Literal(info.path, datatype=XSD.string)))
         return uri
 
     def _add_entity_metadata(self, uri, info, ontology_info=None):
         # Add data object metadata (attributes, annotations) to the entities,
         # using properties from the Alpaca PROV model
-        package_name = info.type.split(".")[0]
         metadata = info.details
+        if not metadata:
+            return
+
+        package_name = _get_package_name(info.type)
+
+        # All name-value pairs are collected and added in a single call
+        quads = []
 
         if package_name in self._metadata_plugins:
             # Handle objects like Neo objects (i.e., to avoid dumping all the
             # information in collections such as `segments` or `events`)
             metadata_nodes = self._metadata_plugins[package_name](
-                self.graph, uri, metadata)
+                self.graph, uri, metadata, quads,
+                new_blank_node=self._new_blank_node)
 
             # Process metadata nodes of the object, if ontology information
             # defined
@@ -275,26 +377,52 @@ class AlpacaProvDocument(object):
                 # Make sure that types such as list and Quantity are handled
                 value = _ensure_type(value)
 
-                blank_node = _add_name_value_pair(self.graph, uri=uri,
-                    predicate=ALPACA.hasAttribute, name=name, value=value)
+                blank_node = _add_name_value_pair(quads, self.graph, uri=uri,
+                    predicate=ALPACA_HAS_ATTRIBUTE, name=name, value=value,
+                    blank_node=self._new_blank_node())
 
                 if ontology_info:
                     self._add_ontology_information(blank_node, ontology_info,
                                                    'attributes', name)
 
+        self.graph.addN(quads)
+
     def _add_membership(self, container, child, params):
         # Add membership relationships according to the standard PROV model
         # and properties specific to the Alpaca PROV model
         predicates = {
-            'name': ALPACA.fromAttribute,
-            'index': ALPACA.containerIndex,
-            'slice': ALPACA.containerSlice,
+            'name': ALPACA_FROM_ATTRIBUTE,
+            'index': ALPACA_CONTAINER_INDEX,
+            'slice': ALPACA_CONTAINER_SLICE,
         }
 
         for name, value in params.items():
             predicate = predicates[name]
             self.graph.add((child, predicate, Literal(value)))
-        self.graph.add((container, PROV.hadMember, child))
+        self.graph.add((container, PROV_HAD_MEMBER, child))
+
+    def _is_repeated_membership(self, execution, script_agent):
+        # Attribute and subscript operations that are executed several times
+        # (e.g., inside loops) produce records that differ only in the
+        # execution ID and time stamps, and generate the same triples.
+        # Returns True if an equivalent record was already added for the
+        # same script agent, as the entities are attributed to the agent.
+        if execution.function.name not in MEMBERSHIP_OPERATIONS:
+            return False
+
+        try:
+            key = (script_agent, execution.function.name,
+                   self._get_entity_uri(execution.input[0]),
+                   self._get_entity_uri(execution.output[0]),
+                   frozenset(execution.params.items()))
+        except TypeError:
+            # Unhashable index values are never considered repeated
+            return False
+
+        if key in self._memberships:
+            return True
+        self._memberships.add(key)
+        return False
 
     def _create_entity(self, info):
         # Create an Alpaca PROV Entity based on DataObject/File information
@@ -311,17 +439,13 @@ class AlpacaProvDocument(object):
         # Add one `FunctionExecution` record to the file, and generate all the
         # provenance semantic relationships
 
-        def _is_membership(function_info):
-            name = function_info.name
-            return name in ("attribute", "subscript")
-
         function_info = execution.function
-        if _is_membership(function_info):
+        if function_info.name in MEMBERSHIP_OPERATIONS:
             # attributes and subscripting operations
             container = execution.input[0]
             child = execution.output[0]
             container_entity = self._create_entity(container)
-            if PROV.wasAttributedTo not in \
+            if PROV_WAS_ATTRIBUTED_TO not in \
                     self.graph.predicates(container_entity, script_agent):
                 self._wasAttributedTo(container_entity, script_agent)
             child_entity = self._create_entity(child)
@@ -353,20 +477,16 @@ class AlpacaProvDocument(object):
             # Python object.
             input_entities = []
             for key, value in execution.input.items():
-                cur_entities = []
                 has_input_uri = ontology_info and \
                                 bool(ontology_info.get_uri('arguments', key))
 
-                if isinstance(value, Container):
-                    # If this is a Container, several objects are inside.
-                    for element in value.elements:
-                        cur_entities.append(self._create_entity(element))
-                else:
-                    cur_entities.append(self._create_entity(value))
-
-                input_entities.extend(cur_entities)
+                # If this is a Container, several objects are inside.
+                elements = value.elements if isinstance(value, Container) \
+                    else (value,)
 
-                for cur_entity in cur_entities:
+                for element in elements:
+                    cur_entity = self._create_entity(element)
+                    input_entities.append(cur_entity)
                     self._used(activity=cur_activity, entity=cur_entity)
                     self._wasAttributedTo(entity=cur_entity,
                                           agent=script_agent)
@@ -420,18 +540,18 @@ class AlpacaProvDocument(object):
             # Fetch information on the function, to identify nodes in the graph
             ontology_info = ONTOLOGY_INFORMATION[info_id]
             function_type = ontology_info.get_uri('function')
-            executions = self.graph.subjects(RDF.type, function_type)
+            executions = self.graph.subjects(RDF_TYPE, function_type)
 
             # For every execution, get the output nodes
             # This is the first level
             for execution in executions:
                 elements_by_level[0].extend(
-                    self.graph.subjects(PROV.wasGeneratedBy, execution))
+                    self.graph.subjects(PROV_WAS_GENERATED_BY, execution))
 
             # Traverse the remaining levels
             for level in range(1, max_level):
                 for element in chain(elements_by_level[level-1]):
-                    members = self.graph.objects(element, PROV.hadMember)
+                    members = self.graph.objects(element, PROV_HAD_MEMBER)
                     elements_by_level[level].extend(members)
 
             # Go from the deepest annotation level, annotating the deepest
@@ -445,7 +565,7 @@ class AlpacaProvDocument(object):
                     has_elements = False
                     for element in chain(elements_by_level[level_depth]):
                         has_elements = True
-                        self.graph.add((element, RDF.type, obj_uri))
+                        self.graph.add((element, RDF_TYPE, obj_uri))
                 else:
                     # No annotation requested for this level
                     # Consider the level traversed
@@ -475,7 +595,10 @@ class AlpacaProvDocument(object):
         session_id : str
             Unique identifier for this script execution.
         history : list of FunctionExecution
-            Provenance history to be serialized as RDF using PROV.
+            Provenance history to be serialized as RDF using PROV. Repeated
+            attribute and subscript operations (e.g., accessing the same
+            element in a loop) are added only once, as they describe the
+            same membership relationship.
         show_progress : bool, optional
             If True, show the progress of the provenance history serialization.
             Default: False
@@ -483,6 +606,8 @@ class AlpacaProvDocument(object):
         script_agent = self._add_ScriptAgent(script_info, session_id)
         for execution in tqdm(history, desc="Serializing provenance history",
                               disable=not show_progress):
+            if self._is_repeated_membership(execution, script_agent):
+                continue
             self._add_function_execution(execution, script_agent, script_info,
                                          session_id)
         self._add_annotations_for_container_outputs()
@@ -0,0 +1,53 @@
+"""
+This module defines the RDF terms used when serializing the provenance
+information.
+
+Attribute access in RDFLib namespaces (e.g., `PROV.used`) builds a new
+`URIRef` every time. As the same terms are used for every function execution
+and object in the history, they are created only once here.
+"""
+
+from rdflib.namespace import RDF, PROV
+
+from alpaca.ontology import ALPACA
+
+
+RDF_TYPE = RDF.type
+
+# PROV-O terms
+PROV_ENDED_AT_TIME = PROV.endedAtTime
+PROV_HAD_MEMBER = PROV.hadMember
+PROV_STARTED_AT_TIME = PROV.startedAtTime
+PROV_USED = PROV.used
+PROV_VALUE = PROV.value
+PROV_WAS_ASSOCIATED_WITH = PROV.wasAssociatedWith
+PROV_WAS_ATTRIBUTED_TO = PROV.wasAttributedTo
+PROV_WAS_DERIVED_FROM = PROV.wasDerivedFrom
+PROV_WAS_GENERATED_BY = PROV.wasGeneratedBy
+
+# Alpaca ontology classes
+ALPACA_DATA_OBJECT_ENTITY = ALPACA.DataObjectEntity
+ALPACA_FILE_ENTITY = ALPACA.FileEntity
+ALPACA_FUNCTION = ALPACA.Function
+ALPACA_FUNCTION_EXECUTION = ALPACA.FunctionExecution
+ALPACA_NAME_VALUE_PAIR = ALPACA.NameValuePair
+ALPACA_SCRIPT_AGENT = ALPACA.ScriptAgent
+
+# Alpaca ontology properties
+ALPACA_CODE_STATEMENT = ALPACA.codeStatement
+ALPACA_CONTAINER_INDEX = ALPACA.containerIndex
+ALPACA_CONTAINER_SLICE = ALPACA.containerSlice
+ALPACA_EXECUTION_ORDER = ALPACA.executionOrder
+ALPACA_FILE_PATH = ALPACA.filePath
+ALPACA_FROM_ATTRIBUTE = ALPACA.fromAttribute
+ALPACA_FUNCTION_NAME = ALPACA.functionName
+ALPACA_FUNCTION_VERSION = ALPACA.functionVersion
+ALPACA_HAS_ANNOTATION = ALPACA.hasAnnotation
+ALPACA_HAS_ATTRIBUTE = ALPACA.hasAttribute
+ALPACA_HAS_PARAMETER = ALPACA.hasParameter
+ALPACA_HASH_SOURCE = ALPACA.hashSource
+ALPACA_IMPLEMENTED_IN = ALPACA.implementedIn
+ALPACA_PAIR_NAME = ALPACA.pairName
+ALPACA_PAIR_VALUE = ALPACA.pairValue
+ALPACA_SCRIPT_PATH = ALPACA.scriptPath
+ALPACA_USED_FUNCTION = ALPACA.usedFunction
@@ -61,18 +61,46 @@ Currently, the following settings can be defined:
         the `builtins.dict` entry. The strings are the full path to the Python
         object, i.e., `[module].[...].[object_class]`.
 
+* **object_hash_algorithm**: {'sha1', 'md5', 'xxh128'}
+        The algorithm used by `joblib.hash` to compute the hashes of the
+        objects. MD5 is faster than SHA1, and the non-cryptographic xxHash
+        (128-bit) is considerably faster than both, in particular for large
+        NumPy arrays. 'xxh128' requires the `xxhash` package, that is
+        installed with the `xxhash` extra (`pip install alpaca-prov[xxhash]`).
+        Note that the hashes identifying the objects will differ from the ones
+        obtained with the default value.
+        The algorithm is stored in the provenance records as the hash method
+        of each object (e.g., `joblib_SHA1`).
 
-To set/read a setting, use the function :func:`alpaca_setting`.
+        Default: 'sha1'
+
+
+To set/read a setting, use the function :func:`alpaca_setting`. This is the
+public interface, that validates the names and values of the settings.
 
 .. autofunction :: alpaca.alpaca_setting
 """
 
+from importlib.util import find_spec
+
 # Global Alpaca settings dictionary
 # Should be modified only through the `alpaca_setting` function.
 
 _ALPACA_SETTINGS = {'use_builtin_hash_for_module': [],
                     'authority': "my-authority",
-                    'store_values': []}
+                    'store_values': [],
+                    'object_hash_algorithm': 'sha1'}
+
+# Types accepted for the value of each setting
+_COLLECTION_TYPES = (list, tuple, set, frozenset)
+
+_SETTINGS_TYPES = {'use_builtin_hash_for_module': _COLLECTION_TYPES,
+                   'authority': (str,),
+                   'store_values': _COLLECTION_TYPES,
+                   'object_hash_algorithm': (str,)}
+
+# Values accepted for settings that take one of a few options
+_SETTINGS_CHOICES = {'object_hash_algorithm': ('sha1', 'md5', 'xxh128')}
 
 
 def alpaca_setting(name, value=None):
@@ -102,9 +130,25 @@ def alpaca_setting(name, value=None):
         raise ValueError(f"Setting '{name}' is not valid.")
 
     if value is not None:
-        expected_type = type(_ALPACA_SETTINGS[name])
-        if type(value) is not expected_type:
-            raise ValueError(f"Setting '{name}' must be '{expected_type}'")
+        expected_types = _SETTINGS_TYPES[name]
+        if not isinstance(value, expected_types):
+            type_names = ', '.join(t.__name__ for t in expected_types)
+            raise ValueError(f"Setting '{name}' must be of type: "
+                             f"{type_names}")
+        if name in _SETTINGS_CHOICES and value not in _SETTINGS_CHOICES[name]:
+            raise ValueError(f"Setting '{name}' must be one of "
+                             f"{_SETTINGS_CHOICES[name]}")
+        if (name == 'object_hash_algorithm' and value == 'xxh128' and
+                find_spec('xxhash') is None):
+            raise ValueError("The 'xxhash' package is required to use the "
+                             "'xxh128' algorithm")
         _ALPACA_SETTINGS[name] = value
 
     return _ALPACA_SETTINGS[name]
+
+
+def _get_setting(name):
+    # Fast access to the current value of setting `name`, for internal use
+    # only. No validation is performed. Callers in loops should read the
+    # value once before iterating.
+    return _ALPACA_SETTINGS[name]
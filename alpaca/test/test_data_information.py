@@ -3,13 +3,33 @@ import unittest
 import numpy as np
 
 from alpaca.alpaca_types import File, DataObject
-from alpaca.data_information import _FileInformation, _ObjectInformation
+from alpaca.data_information import (_FileInformation, _ObjectInformation,
+                                     _HAS_XXHASH, _NON_ANNOTATED_TYPES)
+from alpaca.ontology.annotation import ONTOLOGY_INFORMATION
 
 from pathlib import Path
 import joblib
 import uuid
 
 
+# Files used by the tests
+RES_PATH = Path(__file__).parent.absolute() / "res"
+FILE_INPUT = RES_PATH / "file_input.txt"
+FILE_OUTPUT = RES_PATH / "file_output.txt"
+
+# SHA256 hash of the content of `FILE_INPUT`
+FILE_INPUT_SHA256 = \
+    "96ccc1380e069667069acecea3e2ab559441657807e0a86d14f49028710ddb3a"
+
+# joblib hash of the int64 array [[1, 2, 3, 4], [5, 6, 7, 8]] using the
+# xxHash 128-bit algorithm
+XXH128_ARRAY_HASH = "adf3ef4276601a417a14de4a54ab4dfe"
+
+# Array shared by the tests. It is read-only, as tests rely on its hash
+TEST_ARRAY = np.array([1, 2, 3])
+TEST_ARRAY.setflags(write=False)
+
+
 class ObjectClass(object):
     """
     Class used to test hashing and getting data from custom objects
@@ -19,25 +39,34 @@ class ObjectClass(object):
         self.attribute = "an object class"
 
 
-class FileInformationTestCase(unittest.TestCase):
+class InstanceAnnotatedClass(object):
+    """
+    Class used to test ontology annotations defined in the instances
+    """
+
 
-    @classmethod
-    def setUpClass(cls):
-        cls.file_path = Path(__file__).parent.absolute() / "res"
+class FileInformationTestCase(unittest.TestCase):
 
     def test_file_info_sha256(self):
-        file_input = self.file_path / "file_input.txt"
+        file_input = FILE_INPUT
         file_info = _FileInformation(file_input)
         info = file_info.info()
         self.assertIsInstance(info, File)
         self.assertEqual(info.hash_type, "sha256")
-        self.assertEqual(info.hash, "96ccc1380e069667069acecea3e2ab559441657807e0a86d14f49028710ddb3a")
+        self.assertEqual(info.hash, FILE_INPUT_SHA256)
         self.assertEqual(info.path, file_input)
 
+    def test_file_hash_memory_mapped(self):
+        file_input = FILE_INPUT
+        expected_hash = _FileInformation(file_input).info().hash
+        mapped_hash = _FileInformation._get_content_file_hash(
+            file_input, mmap_threshold=0)
+        self.assertEqual(mapped_hash, expected_hash)
+
     def test_file_info_comparison(self):
-        file_info_1 = _FileInformation(self.file_path / "file_input.txt")
-        file_info_2 = _FileInformation(self.file_path / "file_input.txt")
-        file_info_3 = _FileInformation(self.file_path / "file_output.txt")
+        file_info_1 = _FileInformation(FILE_INPUT)
+        file_info_2 = _FileInformation(FILE_INPUT)
+        file_info_3 = _FileInformation(FILE_OUTPUT)
 
         self.assertTrue(file_info_1 == file_info_2)
 
@@ -47,9 +76,8 @@ class FileInformationTestCase(unittest.TestCase):
         self.assertFalse(file_info_3 == file_info_1)
 
     def test_repr(self):
-        file_info = _FileInformation(self.file_path / "file_input.txt")
-        expected_str = "file_input.txt: [sha256] 96ccc1380e069667069acece" \
-                       "a3e2ab559441657807e0a86d14f49028710ddb3a"
+        file_info = _FileInformation(FILE_INPUT)
+        expected_str = f"file_input.txt: [sha256] {FILE_INPUT_SHA256}"
         self.assertEqual(str(file_info), expected_str)
 
 
@@ -62,6 +90,9 @@ class ObjectInformationTestCase(unittest.TestCase):
         numpy_array_float = np.array([[1, 2, 3, 4],
                                       [5, 6, 7, 8],
                                       [9, 10, 11, 12]], dtype=np.float64)
+        expected_int_hash, expected_float_hash = (
+            joblib.hash(array, hash_name='sha1')
+            for array in (numpy_array_int, numpy_array_float))
 
         object_info = _ObjectInformation()
         info_int = object_info.info(numpy_array_int)
@@ -80,17 +111,38 @@ class ObjectInformationTestCase(unittest.TestCase):
         self.assertEqual(info_float.id, id(numpy_array_float))
         self.assertEqual(info_int.hash_method, "joblib_SHA1")
         self.assertEqual(info_float.hash_method, "joblib_SHA1")
-        self.assertEqual(info_int.hash, joblib.hash(numpy_array_int,
-                                                    hash_name='sha1'))
-        self.assertEqual(info_float.hash, joblib.hash(numpy_array_float,
-                                                      hash_name='sha1'))
+        self.assertEqual(info_int.hash, expected_int_hash)
+        self.assertEqual(info_float.hash, expected_float_hash)
+
+    def test_md5_hash_algorithm(self):
+        numpy_array = np.array([[1, 2, 3, 4],
+                                [5, 6, 7, 8]], dtype=np.int64)
+
+        object_info = _ObjectInformation(hash_algorithm='md5')
+        info = object_info.info(numpy_array)
+
+        self.assertEqual(info.hash_method, "joblib_MD5")
+        self.assertEqual(info.hash, joblib.hash(numpy_array, hash_name='md5'))
+
+    @unittest.skipUnless(_HAS_XXHASH, "xxhash is not installed")
+    def test_xxh128_hash_algorithm(self):
+        numpy_array = np.array([[1, 2, 3, 4],
+                                [5, 6, 7, 8]], dtype=np.int64)
+
+        object_info = _ObjectInformation(hash_algorithm='xxh128')
+        info = object_info.info(numpy_array)
+
+        self.assertEqual(info.hash_method, "joblib_XXH128")
+        self.assertEqual(info.hash, XXH128_ARRAY_HASH)
+        self.assertNotEqual(info.hash,
+                            joblib.hash(numpy_array, hash_name='md5'))
 
     def test_memoization(self):
-        array = np.array([1, 2, 3])
+        array = TEST_ARRAY
         object_info = _ObjectInformation()
         array_id = id(array)
 
-        self.assertDictEqual(object_info._hash_memoizer, {})
+        self.assertFalse(object_info._hash_memoizer)
         self.assertFalse(array_id in object_info._hash_memoizer)
         info_pre = object_info.info(array)
 
@@ -98,13 +150,37 @@ class ObjectInformationTestCase(unittest.TestCase):
         info_post = object_info.info(array)
         self.assertEqual(info_pre, info_post)
 
+    def test_non_annotated_type(self):
+        object_info = _ObjectInformation()
+        object_info.info(TEST_ARRAY)
+        self.assertIn(np.ndarray, _NON_ANNOTATED_TYPES)
+
+        # Instances with `__dict__` may carry their own annotations
+        object_info.info(ObjectClass(5))
+        self.assertNotIn(ObjectClass, _NON_ANNOTATED_TYPES)
+
+    def test_instance_annotation_after_non_annotated(self):
+        obj_type = f"{__name__}.InstanceAnnotatedClass"
+        self.addCleanup(ONTOLOGY_INFORMATION.pop, obj_type, None)
+
+        object_info = _ObjectInformation()
+        object_info.info(InstanceAnnotatedClass())
+        self.assertNotIn(obj_type, ONTOLOGY_INFORMATION)
+
+        annotated = InstanceAnnotatedClass()
+        annotated.__ontology__ = {
+            'data_object': "http://example.org/ontology#Object"}
+        object_info.info(annotated)
+        self.assertEqual(ONTOLOGY_INFORMATION[obj_type].data_object,
+                         "http://example.org/ontology#Object")
+
     def test_none(self):
         object_info = _ObjectInformation()
         info = object_info.info(None)
         self.assertIsInstance(info.hash, uuid.UUID)
         self.assertEqual(info.type, "builtins.NoneType")
         self.assertEqual(info.hash_method, "UUID")
-        self.assertDictEqual(info.details, {})
+        self.assertFalse(info.details)
 
     def test_store_value_requested(self):
         object_info = _ObjectInformation(store_values=['builtins.dict'])
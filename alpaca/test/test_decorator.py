@@ -1,5 +1,6 @@
 import unittest
 
+import functools
 import joblib
 import datetime
 import sys
@@ -19,8 +20,11 @@ from alpaca import (Provenance, activate, deactivate, save_provenance,
 from alpaca.alpaca_types import (FunctionInfo, Container, DataObject, File)
 
 # Define some data and expected values test tracking
+# The arrays are shared by all tests, and are read-only to make sure that
+# their hashes do not change
 
 TEST_ARRAY = np.array([1, 2, 3])
+TEST_ARRAY.setflags(write=False)
 TEST_ARRAY_INFO = DataObject(hash=joblib.hash(TEST_ARRAY, hash_name='sha1'),
                              hash_method="joblib_SHA1",
                              type="numpy.ndarray", id=id(TEST_ARRAY),
@@ -28,6 +32,7 @@ TEST_ARRAY_INFO = DataObject(hash=joblib.hash(TEST_ARRAY, hash_name='sha1'),
                              value=None)
 
 TEST_ARRAY_2 = np.array([4, 5, 6])
+TEST_ARRAY_2.setflags(write=False)
 TEST_ARRAY_2_INFO = DataObject(hash=joblib.hash(TEST_ARRAY_2,
                                                 hash_name='sha1'),
                                hash_method="joblib_SHA1",
@@ -37,6 +42,54 @@ TEST_ARRAY_2_INFO = DataObject(hash=joblib.hash(TEST_ARRAY_2,
 
 CONTAINER = [TEST_ARRAY, TEST_ARRAY_2]
 
+# Folder with the files used by the tests
+RES_PATH = Path(__file__).parent.absolute() / "res"
+
+# SHA256 hash of the content of `file_input.txt`
+FILE_INPUT_SHA256 = \
+    "96ccc1380e069667069acecea3e2ab559441657807e0a86d14f49028710ddb3a"
+
+# Hashes of the outputs expected from the tracked functions, that are used
+# by several tests
+
+TEST_ARRAY_PLUS_3_HASH = joblib.hash(TEST_ARRAY + 3, hash_name='sha1')
+TEST_ARRAY_PLUS_4_HASH = joblib.hash(TEST_ARRAY + 4, hash_name='sha1')
+TEST_ARRAY_PLUS_5_HASH = joblib.hash(TEST_ARRAY + 5, hash_name='sha1')
+CONTAINER_MEAN = np.float64(3.5)
+CONTAINER_MEAN_HASH = joblib.hash(CONTAINER_MEAN, hash_name='sha1')
+
+# Information of the mean of `CONTAINER`. The object ID is replaced in each
+# test
+CONTAINER_MEAN_INFO = DataObject(hash=CONTAINER_MEAN_HASH,
+                                 hash_method="joblib_SHA1",
+                                 type="numpy.float64", id=None,
+                                 details={'shape': (), 'dtype': np.float64},
+                                 value=CONTAINER_MEAN)
+
+# Information of the functions that are expected in several tests.
+# `SUBSCRIPT_INFO` identifies the accesses to elements of container outputs
+
+SIMPLE_FUNCTION_INFO = FunctionInfo('simple_function', 'test_decorator', '')
+SIMPLE_FUNCTION_DEFAULT_INFO = FunctionInfo('simple_function_default',
+                                            'test_decorator', '')
+MULTIPLE_OUTPUTS_FUNCTION_INFO = FunctionInfo('multiple_outputs_function',
+                                              'test_decorator', '')
+COMPREHENSION_FUNCTION_INFO = FunctionInfo('comprehension_function',
+                                           'test_decorator', '')
+USE_DICT_INFO = FunctionInfo('use_dict', 'test_decorator', '')
+SUBSCRIPT_INFO = FunctionInfo('subscript', '', '')
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy_scalar_hash(dtype, value):
+    return joblib.hash(dtype.type(value), hash_name='sha1')
+
+
+def numpy_scalar_hash(element):
+    # Hash of a NumPy scalar. The same elements are expected by several tests
+    # of container outputs, so the hashes are cached by type and value
+    return _numpy_scalar_hash(element.dtype, element.item())
+
 
 # Define some functions to test tracking in different scenarios
 
@@ -194,6 +247,18 @@ NonIterableContainerOutputObject.__init__ = \
 
 
 # Function to help verifying FunctionExecution tuples
+def _fill_object_ids(expected, actual):
+    # Expected objects whose `id` is None match any object ID. The ID is
+    # taken from the actual object, so that the dictionaries can be compared
+    # at once
+    filled = {}
+    for key, value in expected.items():
+        if getattr(value, 'id', 0) is None and key in actual:
+            value = value._replace(id=actual[key].id)
+        filled[key] = value
+    return filled
+
+
 def _check_function_execution(actual, exp_function, exp_input, exp_params,
                               exp_output, exp_arg_map, exp_kwarg_map,
                               exp_code_stmnt, exp_return_targets, exp_order,
@@ -202,27 +267,15 @@ def _check_function_execution(actual, exp_function, exp_input, exp_params,
     test_case.assertTupleEqual(actual.function, exp_function)
 
     # Check inputs
-    for input_arg, value in exp_input.items():
-        test_case.assertTrue(input_arg in actual.input)
-        actual_input = actual.input[input_arg]
-        for attr in value._fields:
-            actual_value = getattr(actual_input, attr)
-            exp_value = getattr(value, attr)
-            if attr != 'id' or (attr == 'id' and exp_value is not None):
-                test_case.assertEqual(actual_value, exp_value)
+    test_case.assertDictEqual(actual.input,
+                              _fill_object_ids(exp_input, actual.input))
 
     # Check parameters
     test_case.assertDictEqual(actual.params, exp_params)
 
     # Check outputs
-    for output, value in exp_output.items():
-        test_case.assertTrue(output in actual.output)
-        actual_output = actual.output[output]
-        for attr in value._fields:
-            actual_value = getattr(actual_output, attr)
-            exp_value = getattr(value, attr)
-            if attr != 'id' or (attr == 'id' and exp_value is not None):
-                test_case.assertEqual(actual_value, exp_value)
+    test_case.assertDictEqual(actual.output,
+                              _fill_object_ids(exp_output, actual.output))
 
     # Check args and kwargs
     if actual.arg_map is not None:
@@ -320,10 +373,10 @@ class ProvenanceDecoratorInterfaceFunctionsTestCase(unittest.TestCase):
                 serialization = save_provenance(None, file_format=output_format)
 
                 short_graph = rdflib.Graph()
-                short_graph.parse(StringIO(short), format=output_format)
+                short_graph.parse(data=short, format=output_format)
 
                 serialization_graph = rdflib.Graph()
-                serialization_graph.parse(StringIO(serialization),
+                serialization_graph.parse(data=serialization,
                                           format=output_format)
 
                 self.assertTrue(short_graph.isomorphic(serialization_graph))
@@ -379,33 +432,6 @@ class ProvenanceDecoratorFunctionsTestCase(unittest.TestCase):
 
 class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
-    def test_simple_function(self):
-        activate(clear=True)
-        res = simple_function(TEST_ARRAY, 1, 2)
-        deactivate()
-
-        self.assertEqual(len(Provenance.history), 1)
-
-        expected_output = DataObject(
-            hash=joblib.hash(TEST_ARRAY+3, hash_name='sha1'),
-            hash_method="joblib_SHA1",
-            type="numpy.ndarray", id=id(res),
-            details={'shape': (3,), 'dtype': np.int64}, value=None)
-
-        _check_function_execution(
-            actual=Provenance.history[0],
-            exp_function=FunctionInfo('simple_function',
-                                      'test_decorator', ''),
-            exp_input={'array': TEST_ARRAY_INFO},
-            exp_params={'param1': 1, 'param2': 2},
-            exp_output={0: expected_output},
-            exp_arg_map=['array', 'param1', 'param2'],
-            exp_kwarg_map=[],
-            exp_code_stmnt="res = simple_function(TEST_ARRAY, 1, 2)",
-            exp_return_targets=['res'],
-            exp_order=1,
-            test_case=self)
-
     def test_simple_function_no_target(self):
         activate(clear=True)
         simple_function(TEST_ARRAY, param2=1, param1=2)
@@ -419,15 +445,14 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         output_id = Provenance.history[0].output[0].id
 
         expected_output = DataObject(
-            hash=joblib.hash(TEST_ARRAY+3, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_3_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=output_id,
             details={'shape': (3,), 'dtype': np.int64}, value=None)
 
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('simple_function',
-                                      'test_decorator', ''),
+            exp_function=SIMPLE_FUNCTION_INFO,
             exp_input={'array': TEST_ARRAY_INFO},
             exp_params={'param1': 2, 'param2': 1},
             exp_output={0: expected_output},
@@ -438,86 +463,77 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             exp_order=1,
             test_case=self)
 
-    def test_kwargs_params(self):
-        activate(clear=True)
-        res = simple_function(TEST_ARRAY, 1, param2=2)
-        deactivate()
-
-        self.assertEqual(len(Provenance.history), 1)
-
-        expected_output = DataObject(
-            hash=joblib.hash(TEST_ARRAY+3, hash_name='sha1'),
-            hash_method="joblib_SHA1",
-            type="numpy.ndarray", id=id(res),
-            details={'shape': (3,), 'dtype': np.int64}, value=None)
-
-        _check_function_execution(
-            actual=Provenance.history[0],
-            exp_function=FunctionInfo('simple_function',
-                                      'test_decorator', ''),
-            exp_input={'array': TEST_ARRAY_INFO},
-            exp_params={'param1': 1, 'param2': 2},
-            exp_output={0: expected_output},
-            exp_arg_map=['array', 'param1'],
-            exp_kwarg_map=['param2'],
-            exp_code_stmnt="res = simple_function(TEST_ARRAY, 1, param2=2)",
-            exp_return_targets=['res'],
-            exp_order=1,
-            test_case=self)
-
-    def test_kwargs_params_default(self):
-        activate(clear=True)
-        res = simple_function_default(TEST_ARRAY, 1)
-        deactivate()
-
+    def _check_simple_function(self, res, exp_function, exp_hash,
+                               exp_params, exp_arg_map, exp_kwarg_map,
+                               exp_code_stmnt):
         self.assertEqual(len(Provenance.history), 1)
 
         expected_output = DataObject(
-            hash=joblib.hash(TEST_ARRAY+5, hash_name='sha1'),
+            hash=exp_hash,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res),
             details={'shape': (3,), 'dtype': np.int64}, value=None)
 
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('simple_function_default',
-                                      'test_decorator', ''),
+            exp_function=exp_function,
             exp_input={'array': TEST_ARRAY_INFO},
-            exp_params={'param1': 1, 'param2': 10},
+            exp_params=exp_params,
             exp_output={0: expected_output},
-            exp_arg_map=['array', 'param1'],
-            exp_kwarg_map=['param2'],
-            exp_code_stmnt="res = simple_function_default(TEST_ARRAY, 1)",
+            exp_arg_map=exp_arg_map,
+            exp_kwarg_map=exp_kwarg_map,
+            exp_code_stmnt=exp_code_stmnt,
             exp_return_targets=['res'],
             exp_order=1,
             test_case=self)
 
-    def test_kwargs_params_default_override(self):
+    def test_simple_function_parameters(self):
+        # Tracking is activated once for all the cases, and the history is
+        # cleared before each call
         activate(clear=True)
-        res = simple_function_default(TEST_ARRAY, 1, 8)
-        deactivate()
-
-        self.assertEqual(len(Provenance.history), 1)
-
-        expected_output = DataObject(
-            hash=joblib.hash(TEST_ARRAY+5, hash_name='sha1'),
-            hash_method="joblib_SHA1",
-            type="numpy.ndarray", id=id(res),
-            details={'shape': (3,), 'dtype': np.int64}, value=None)
-
-        _check_function_execution(
-            actual=Provenance.history[0],
-            exp_function=FunctionInfo('simple_function_default',
-                                      'test_decorator', ''),
-            exp_input={'array': TEST_ARRAY_INFO},
-            exp_params={'param1': 1, 'param2': 8},
-            exp_output={0: expected_output},
-            exp_arg_map=['array', 'param1', 'param2'],
-            exp_kwarg_map=[],
-            exp_code_stmnt="res = simple_function_default(TEST_ARRAY, 1, 8)",
-            exp_return_targets=['res'],
-            exp_order=1,
-            test_case=self)
+        self.addCleanup(deactivate)
+
+        with self.subTest("positional parameters"):
+            Provenance.clear()
+            res = simple_function(TEST_ARRAY, 1, 2)
+            self._check_simple_function(
+                res, SIMPLE_FUNCTION_INFO, TEST_ARRAY_PLUS_3_HASH,
+                exp_params={'param1': 1, 'param2': 2},
+                exp_arg_map=['array', 'param1', 'param2'],
+                exp_kwarg_map=[],
+                exp_code_stmnt="res = simple_function(TEST_ARRAY, 1, 2)")
+
+        with self.subTest("keyword parameters"):
+            Provenance.clear()
+            res = simple_function(TEST_ARRAY, 1, param2=2)
+            self._check_simple_function(
+                res, SIMPLE_FUNCTION_INFO, TEST_ARRAY_PLUS_3_HASH,
+                exp_params={'param1': 1, 'param2': 2},
+                exp_arg_map=['array', 'param1'],
+                exp_kwarg_map=['param2'],
+                exp_code_stmnt="res = simple_function(TEST_ARRAY, 1, "
+                               "param2=2)")
+
+        with self.subTest("default parameters"):
+            Provenance.clear()
+            res = simple_function_default(TEST_ARRAY, 1)
+            self._check_simple_function(
+                res, SIMPLE_FUNCTION_DEFAULT_INFO, TEST_ARRAY_PLUS_5_HASH,
+                exp_params={'param1': 1, 'param2': 10},
+                exp_arg_map=['array', 'param1'],
+                exp_kwarg_map=['param2'],
+                exp_code_stmnt="res = simple_function_default(TEST_ARRAY, 1)")
+
+        with self.subTest("default parameters overridden"):
+            Provenance.clear()
+            res = simple_function_default(TEST_ARRAY, 1, 8)
+            self._check_simple_function(
+                res, SIMPLE_FUNCTION_DEFAULT_INFO, TEST_ARRAY_PLUS_5_HASH,
+                exp_params={'param1': 1, 'param2': 8},
+                exp_arg_map=['array', 'param1', 'param2'],
+                exp_kwarg_map=[],
+                exp_code_stmnt="res = simple_function_default(TEST_ARRAY, "
+                               "1, 8)")
 
     def test_container_input_function(self):
         activate(clear=True)
@@ -525,13 +541,9 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         deactivate()
 
         self.assertEqual(len(Provenance.history), 1)
-        self.assertEqual(avg, 3.5)
+        self.assertEqual(avg, CONTAINER_MEAN)
 
-        expected_output = DataObject(
-            hash=joblib.hash(np.float64(3.5), hash_name='sha1'),
-            hash_method="joblib_SHA1",
-            type="numpy.float64", id=id(avg),
-            details={'shape': (), 'dtype': np.float64}, value=3.5)
+        expected_output = CONTAINER_MEAN_INFO._replace(id=id(avg))
 
         _check_function_execution(
             actual=Provenance.history[0],
@@ -554,13 +566,9 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         deactivate()
 
         self.assertEqual(len(Provenance.history), 1)
-        self.assertEqual(avg, 3.5)
+        self.assertEqual(avg, CONTAINER_MEAN)
 
-        expected_output = DataObject(
-            hash=joblib.hash(np.float64(3.5), hash_name='sha1'),
-            hash_method="joblib_SHA1",
-            type="numpy.float64", id=id(avg),
-            details={'shape': (), 'dtype': np.float64}, value=3.5)
+        expected_output = CONTAINER_MEAN_INFO._replace(id=id(avg))
 
         _check_function_execution(
             actual=Provenance.history[0],
@@ -613,21 +621,20 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         self.assertEqual(len(Provenance.history), 1)
 
         expected_output_1 = DataObject(
-            hash=joblib.hash(TEST_ARRAY+3, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_3_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res1),
             details={'shape': (3,), 'dtype': np.int64}, value=None)
 
         expected_output_2 = DataObject(
-            hash=joblib.hash(TEST_ARRAY+4, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_4_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res2),
             details={'shape': (3,), 'dtype': np.int64}, value=None)
 
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('multiple_outputs_function',
-                                      'test_decorator', ''),
+            exp_function=MULTIPLE_OUTPUTS_FUNCTION_INFO,
             exp_input={'array': TEST_ARRAY_INFO},
             exp_params={'param1': 3, 'param2': 6},
             exp_output={0: expected_output_1, 1: expected_output_2},
@@ -653,8 +660,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('multiple_outputs_function',
-                                      'test_decorator', ''),
+            exp_function=MULTIPLE_OUTPUTS_FUNCTION_INFO,
             exp_input={'array': TEST_ARRAY_INFO},
             exp_params={'param1': 3, 'param2': 6},
             exp_output={0: expected_output},
@@ -673,13 +679,13 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         self.assertEqual(len(Provenance.history), 1)
 
         expected_output_1 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 3, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_3_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res[0]),
             details={'shape': (3,), 'dtype': np.int64}, value=None)
 
         expected_output_2 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 4, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_4_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res[1]),
             details={'shape': (3,), 'dtype': np.int64}, value=None)
@@ -724,7 +730,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         # Check the subscript of each array with respect to the list returned
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 0},
             exp_output={0: expected_container_1},
@@ -737,7 +743,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[1],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 1},
             exp_output={0: expected_container_2},
@@ -774,7 +780,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         for idx, container in enumerate(res):
             for element in container:
                 element_info = DataObject(
-                    hash=joblib.hash(element, hash_name="sha1"),
+                    hash=numpy_scalar_hash(element),
                     hash_method="joblib_SHA1",
                     type="numpy.int64", id=None,
                     details={'shape': (), 'dtype': np.int64},
@@ -792,7 +798,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             details={'shape': (3,), 'dtype': np.int64}, value=None)
 
         expected_container_2 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 3, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_3_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res[1]),
             details={'shape': (3,), 'dtype': np.int64}, value=None)
@@ -806,7 +812,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             element = element_index[1]
             _check_function_execution(
                 actual=Provenance.history[history_index],
-                exp_function=FunctionInfo('subscript', '', ''),
+                exp_function=SUBSCRIPT_INFO,
                 exp_input={0: containers[container]},
                 exp_params={'index': element},
                 exp_output={0: elements[container][element]},
@@ -820,7 +826,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         # Check the subscript of each array with respect to the list returned
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 0},
             exp_output={0: expected_container_1},
@@ -833,7 +839,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[4],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 1},
             exp_output={0: expected_container_2},
@@ -886,7 +892,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         # Check the subscript of each array with respect to the list returned
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 0},
             exp_output={0: expected_container_1},
@@ -899,7 +905,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[1],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 1},
             exp_output={0: expected_container_2},
@@ -937,7 +943,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         for idx, container in enumerate(res):
             for el_idx, element in enumerate(container):
                 element_info = DataObject(
-                    hash=joblib.hash(element, hash_name="sha1"),
+                    hash=numpy_scalar_hash(element),
                     hash_method="joblib_SHA1",
                     type="numpy.int64", id=None,
                     details={'shape': (), 'dtype': np.int64}, value=element)
@@ -948,7 +954,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             type="builtins.list", id=id(res), details={}, value=None)
 
         expected_container_1 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 5, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_5_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res[0]),
             details={'shape': (3,), 'dtype': np.int64}, value=None)
@@ -968,7 +974,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             element = element_index[1]
             _check_function_execution(
                 actual=Provenance.history[history_index],
-                exp_function=FunctionInfo('subscript', '', ''),
+                exp_function=SUBSCRIPT_INFO,
                 exp_input={0: containers[container]},
                 exp_params={'index': element},
                 exp_output={0: elements[container][element]},
@@ -982,7 +988,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         # Check the subscript of each array with respect to the list returned
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 0},
             exp_output={0: expected_container_1},
@@ -995,7 +1001,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[4],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 1},
             exp_output={0: expected_container_2},
@@ -1032,7 +1038,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         for idx, container in enumerate(res):
             for el_idx, element in enumerate(container):
                 element_info = DataObject(
-                    hash=joblib.hash(element, hash_name="sha1"),
+                    hash=numpy_scalar_hash(element),
                     hash_method="joblib_SHA1",
                     type="numpy.int64", id=None,
                     details={'shape': (), 'dtype': np.int64},
@@ -1040,14 +1046,14 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
                 elements[idx].append(element_info)
 
         expected_container_1 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 4, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_4_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res[0]),
             details={'shape': (3,), 'dtype': np.int64},
             value=None)
 
         expected_container_2 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 5, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_5_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res[1]),
             details={'shape': (3,), 'dtype': np.int64},
@@ -1062,7 +1068,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             element = element_index[1]
             _check_function_execution(
                 actual=Provenance.history[history_index],
-                exp_function=FunctionInfo('subscript', '', ''),
+                exp_function=SUBSCRIPT_INFO,
                 exp_input={0: containers[container]},
                 exp_params={'index': element},
                 exp_output={0: elements[container][element]},
@@ -1101,14 +1107,14 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             type="builtins.dict", id=id(res), details={}, value=None)
 
         expected_container_1 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 3, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_3_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res['key.0']),
             details={'shape': (3,), 'dtype': np.int64},
             value=None)
 
         expected_container_2 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 4, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_4_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res['key.1']),
             details={'shape': (3,), 'dtype': np.int64},
@@ -1116,7 +1122,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 'key.0'},
             exp_output={0: expected_container_1},
@@ -1129,7 +1135,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[1],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 'key.1'},
             exp_output={0: expected_container_2},
@@ -1166,7 +1172,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         for key, container in res.items():
             for element in container:
                 element_info = DataObject(
-                    hash=joblib.hash(element, hash_name="sha1"),
+                    hash=numpy_scalar_hash(element),
                     hash_method="joblib_SHA1",
                     type="numpy.int64", id=None,
                     details={'shape': (), 'dtype': np.int64},
@@ -1178,14 +1184,14 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             type="builtins.dict", id=id(res), details={}, value=None)
 
         expected_container_1 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 3, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_3_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res['key.0']),
             details={'shape': (3,), 'dtype': np.int64},
             value=None)
 
         expected_container_2 = DataObject(
-            hash=joblib.hash(TEST_ARRAY + 4, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_4_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res['key.1']),
             details={'shape': (3,), 'dtype': np.int64},
@@ -1204,7 +1210,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             element = element_index[1]
             _check_function_execution(
                 actual=Provenance.history[history_index],
-                exp_function=FunctionInfo('subscript', '', ''),
+                exp_function=SUBSCRIPT_INFO,
                 exp_input={0: containers[container]},
                 exp_params={'index': element},
                 exp_output={0: elements[container][element]},
@@ -1218,7 +1224,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         # Check subscript of each array with respect to the dictionary returned
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 'key.0'},
             exp_output={0: expected_container_1},
@@ -1231,7 +1237,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[4],
-            exp_function=FunctionInfo('subscript', '', ''),
+            exp_function=SUBSCRIPT_INFO,
             exp_input={0: expected_output},
             exp_params={'index': 'key.1'},
             exp_output={0: expected_container_2},
@@ -1267,7 +1273,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         elements = []
         for element in res:
             element_info = DataObject(
-                hash=joblib.hash(element, hash_name="sha1"),
+                hash=numpy_scalar_hash(element),
                 hash_method="joblib_SHA1",
                 type="numpy.int64", id=None,
                 details={'shape': (), 'dtype': np.int64},
@@ -1284,7 +1290,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
             element = elements[history_index]
             _check_function_execution(
                 actual=Provenance.history[history_index],
-                exp_function=FunctionInfo('subscript', '', ''),
+                exp_function=SUBSCRIPT_INFO,
                 exp_input={0: expected_output},
                 exp_params={'index': history_index},
                 exp_output={0: element},
@@ -1325,7 +1331,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         # Check executions of the list comprehension
         for history, element in zip((0, 1, 2), num_list):
             expected_output = DataObject(
-                hash=joblib.hash(element, hash_name='sha1'),
+                hash=numpy_scalar_hash(element),
                 hash_method="joblib_SHA1",
                 type="numpy.float64", id=id(element),
                 details={'shape': (), 'dtype': np.float64},
@@ -1333,8 +1339,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
             _check_function_execution(
                 actual=Provenance.history[history],
-                exp_function=FunctionInfo('comprehension_function',
-                                          'test_decorator', ''),
+                exp_function=COMPREHENSION_FUNCTION_INFO,
                 exp_input={},
                 exp_params={'param': history},
                 exp_output={0: expected_output},
@@ -1348,7 +1353,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         # Check executions of the set comprehension
         for history, element in zip((3, 4, 5), num_set):
             expected_output = DataObject(
-                hash=joblib.hash(element, hash_name='sha1'),
+                hash=numpy_scalar_hash(element),
                 hash_method="joblib_SHA1",
                 type="numpy.float64", id=id(element),
                 details={'shape': (), 'dtype': np.float64},
@@ -1356,8 +1361,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
             _check_function_execution(
                 actual=Provenance.history[history],
-                exp_function=FunctionInfo('comprehension_function',
-                                          'test_decorator', ''),
+                exp_function=COMPREHENSION_FUNCTION_INFO,
                 exp_input={},
                 exp_params={'param': history},
                 exp_output={0: expected_output},
@@ -1371,7 +1375,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
         # Check executions of the dict comprehension
         for history, element in zip((6, 7, 8), num_dict.values()):
             expected_output = DataObject(
-                hash=joblib.hash(element, hash_name='sha1'),
+                hash=numpy_scalar_hash(element),
                 hash_method="joblib_SHA1",
                 type="numpy.float64", id=id(element),
                 details={'shape': (), 'dtype': np.float64},
@@ -1379,8 +1383,7 @@ class ProvenanceDecoratorInputOutputCombinationsTestCase(unittest.TestCase):
 
             _check_function_execution(
                 actual=Provenance.history[history],
-                exp_function=FunctionInfo('comprehension_function',
-                                          'test_decorator', ''),
+                exp_function=COMPREHENSION_FUNCTION_INFO,
                 exp_input={},
                 exp_params={'param': history},
                 exp_output={0: expected_output},
@@ -1409,7 +1412,7 @@ class ProvenanceDecoratorFileInputOutputTestCase(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.res_path = Path(__file__).parent.absolute() / "res"
+        cls.res_path = RES_PATH
 
     def test_file_input(self):
         activate(clear=True)
@@ -1426,7 +1429,7 @@ class ProvenanceDecoratorFileInputOutputTestCase(unittest.TestCase):
             hash_method="joblib_SHA1",
             type="builtins.list", id=id(res), details={}, value=None)
 
-        expected_file = File("96ccc1380e069667069acecea3e2ab559441657807e0a86d14f49028710ddb3a",
+        expected_file = File(FILE_INPUT_SHA256,
                              hash_type="sha256", path=file_name)
 
         _check_function_execution(
@@ -1528,7 +1531,7 @@ class ProvenanceDecoratorClassMethodsTestCase(unittest.TestCase):
             value=None)
 
         expected_output = DataObject(
-            hash=joblib.hash(TEST_ARRAY+4, hash_name='sha1'),
+            hash=TEST_ARRAY_PLUS_4_HASH,
             hash_method="joblib_SHA1",
             type="numpy.ndarray", id=id(res),
             details={'shape': (3,), 'dtype': np.int64},
@@ -1670,7 +1673,7 @@ class ProvenanceDecoratorClassMethodsTestCase(unittest.TestCase):
         elements = []
         for element in obj:
                 element_info = DataObject(
-                    hash=joblib.hash(element, hash_name="sha1"),
+                    hash=numpy_scalar_hash(element),
                     hash_method="joblib_SHA1",
                     type="numpy.int64", id=None,
                     details={'shape': (), 'dtype': np.int64},
@@ -1690,7 +1693,7 @@ class ProvenanceDecoratorClassMethodsTestCase(unittest.TestCase):
             element = elements[history_index]
             _check_function_execution(
                 actual=Provenance.history[history_index],
-                exp_function=FunctionInfo('subscript', '', ''),
+                exp_function=SUBSCRIPT_INFO,
                 exp_input={0: expected_output},
                 exp_params={'index': history_index},
                 exp_output={0: element},
@@ -1749,7 +1752,7 @@ class ProvenanceDecoratorStoreValuesTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('use_dict', 'test_decorator', ''),
+            exp_function=USE_DICT_INFO,
             exp_input={'source': dict_info},
             exp_params={},
             exp_output={0: expected_output},
@@ -1779,7 +1782,7 @@ class ProvenanceDecoratorStoreValuesTestCase(unittest.TestCase):
 
         _check_function_execution(
             actual=Provenance.history[0],
-            exp_function=FunctionInfo('use_dict', 'test_decorator', ''),
+            exp_function=USE_DICT_INFO,
             exp_input={'source': dict_info},
             exp_params={},
             exp_output={0: expected_output},
@@ -0,0 +1,58 @@
+import unittest
+
+import ast
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import quantities as pq
+
+
+EXAMPLES_PATH = Path(__file__).parents[2] / "examples"
+
+# Packages required to import the example scripts
+HAS_EXAMPLES_REQUIREMENTS = all(
+    importlib.util.find_spec(package) is not None
+    for package in ('matplotlib', 'neo', 'elephant'))
+
+
+def _load_example(name):
+    spec = importlib.util.spec_from_file_location(
+        name, EXAMPLES_PATH / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipUnless(EXAMPLES_PATH.is_dir(), "Examples are not available")
+class ExampleScriptsTestCase(unittest.TestCase):
+
+    def test_examples_parse(self):
+        # The examples require datasets and packages that are not installed
+        # for the tests. Check only that the scripts are valid Python code
+        for script in sorted(EXAMPLES_PATH.glob("*.py")):
+            with self.subTest(script=script.name):
+                ast.parse(script.read_text(encoding='utf-8'),
+                          filename=str(script))
+
+    @unittest.skipUnless(HAS_EXAMPLES_REQUIREMENTS,
+                         "Requirements of the examples are not installed")
+    def test_isi_histogram_non_integer_bin_size(self):
+        run_basic = _load_example("run_basic")
+
+        # ISIs quantized to the bin size, so that many values are at the
+        # bin edges, and values between the edges
+        rng = np.random.default_rng(0)
+        bin_size = 0.1 * pq.ms
+        quantized = np.round(rng.exponential(10, 200000) / 0.1) * 0.1
+        uniform = rng.uniform(0, 60, 10000)
+
+        for isi_times in (quantized * pq.ms, uniform * pq.ms):
+            with self.subTest(isi_times=isi_times[:3]):
+                counts, edges = run_basic.isi_histogram(
+                    isi_times, bin_size=bin_size, max_time=50 * pq.ms)
+                expected_counts, expected_edges = np.histogram(
+                    isi_times.magnitude, bins=edges.magnitude)
+                np.testing.assert_array_equal(counts, expected_counts)
+                np.testing.assert_array_equal(edges.magnitude,
+                                              expected_edges)
@@ -1,5 +1,4 @@
 import unittest
-import io
 from rdflib import Literal, URIRef, Namespace, Graph, RDF, PROV
 
 from alpaca import activate, deactivate, Provenance, save_provenance
@@ -12,6 +11,10 @@ from collections import Counter
 # Ontology namespace definition used for the tests
 EXAMPLE_NS = {'ontology': "http://example.org/ontology#"}
 
+# URIs expected by several annotation tests
+PARAMETER_URI = URIRef("http://example.org/ontology#Parameter")
+PROCESSED_DATA_URI = URIRef("http://example.org/ontology#ProcessedData")
+
 
 ##############################
 # Test objects to be annotated
@@ -170,6 +173,11 @@ def process_no_annotations(input):
     return input + 2
 
 
+def _count_types(graph):
+    # Counts the subjects of each class with a single pass over the graph
+    return Counter(obj for obj in graph.objects(None, RDF.type))
+
+
 ############
 # Unit tests
 ############
@@ -181,10 +189,53 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         # Create rdflib Namespace for tests
         cls.ONTOLOGY = Namespace(EXAMPLE_NS['ontology'])
 
+        # Provenance graphs shared by the tests of the same function
+        cls.prov_graphs = {}
+
     def setUp(self):
         _OntologyInformation.namespaces.clear()
         ONTOLOGY_INFORMATION.clear()
 
+    @staticmethod
+    def _track_function(function, param, unpack_outputs):
+        # Tracks `function` with an `InputObject` and the parameter `param`,
+        # and returns the RDF graph. If `unpack_outputs` is True, the two
+        # returned elements are tracked as separate outputs
+        activate(clear=True)
+        input_object = InputObject()
+        if unpack_outputs:
+            _, output = function(input_object, param)
+        else:
+            output = function(input_object, param)
+        deactivate()
+        return Provenance.get_prov_info().graph
+
+    @classmethod
+    def _get_prov_graph(cls, function, param, unpack_outputs=False):
+        # The RDF graph is built at the first request, and reused by the
+        # other tests checking the same function. The set of all triples is
+        # also returned, for fast checking of fully defined triples
+        if function not in cls.prov_graphs:
+            prov_graph = cls._track_function(function, param, unpack_outputs)
+            cls.prov_graphs[function] = (prov_graph, frozenset(prov_graph))
+        return cls.prov_graphs[function]
+
+    def _check_output_attributes(self, prov_graph, output_node,
+                                 expected_attributes):
+        # Collect all attributes of the output node, and compare them at once
+        attributes = {}
+        attribute_nodes = {}
+        for attribute in prov_graph.objects(output_node, ALPACA.hasAttribute):
+            name = prov_graph.value(attribute, ALPACA.pairName).toPython()
+            value = prov_graph.value(attribute, ALPACA.pairValue).toPython()
+            attributes[name] = value
+            attribute_nodes[name] = attribute
+        self.assertDictEqual(attributes, expected_attributes)
+
+        # Check if attribute annotation is present for `name`
+        self.assertTrue((attribute_nodes['name'], RDF.type,
+                         self.ONTOLOGY.Attribute) in prov_graph)
+
     def test_redefine_namespaces(self):
         obj = InputObject()
         self.assertDictEqual(_OntologyInformation.namespaces, {})
@@ -202,6 +253,14 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         self.assertEqual(info.namespaces['purl_ontology'],
                          Namespace("http://purl.org/ontology"))
 
+    def test_namespace_shared_by_uri(self):
+        _OntologyInformation.add_namespace('ontology_1', EXAMPLE_NS['ontology'])
+        namespace = _OntologyInformation.namespaces['ontology_1']
+
+        _OntologyInformation.namespaces.clear()
+        _OntologyInformation.add_namespace('ontology_2', EXAMPLE_NS['ontology'])
+        self.assertIs(_OntologyInformation.namespaces['ontology_2'], namespace)
+
     def test_annotation_object_input_uri(self):
         obj = InputObjectURI()
         self.assertIsNotNone(
@@ -259,10 +318,10 @@ class OntologyAnnotationTestCase(unittest.TestCase):
             URIRef("http://example.org/ontology#ProcessFunction"))
         self.assertEqual(
             info.get_uri("arguments", "param_1"),
-            URIRef("http://example.org/ontology#Parameter"))
+            PARAMETER_URI)
         self.assertEqual(
             info.get_uri("returns", 0),
-            URIRef("http://example.org/ontology#ProcessedData"))
+            PROCESSED_DATA_URI)
         self.assertEqual(
             str(info),
             "OntologyInformation(function='ontology:ProcessFunction', "
@@ -282,10 +341,10 @@ class OntologyAnnotationTestCase(unittest.TestCase):
              URIRef("http://example.org/ontology#Process2Function")])
         self.assertEqual(
             info.get_uri("arguments", "param_1"),
-            URIRef("http://example.org/ontology#Parameter"))
+            PARAMETER_URI)
         self.assertEqual(
             info.get_uri("returns", 0),
-            URIRef("http://example.org/ontology#ProcessedData"))
+            PROCESSED_DATA_URI)
         self.assertEqual(
             str(info),
             "OntologyInformation(function='['ontology:Process1Function', "
@@ -303,7 +362,7 @@ class OntologyAnnotationTestCase(unittest.TestCase):
             URIRef("http://example.org/ontology#ProcessFunctionMultiple"))
         self.assertEqual(
             info.get_uri("arguments", "param_1"),
-            URIRef("http://example.org/ontology#Parameter"))
+            PARAMETER_URI)
         self.assertEqual(
             info.get_uri("returns", 1),
             URIRef("http://example.org/ontology#ProcessedDataMultiple"))
@@ -315,6 +374,15 @@ class OntologyAnnotationTestCase(unittest.TestCase):
             "returns={1: 'ontology:ProcessedDataMultiple'})"
         )
 
+    def test_uri_resolved_once(self):
+        info = _OntologyInformation(process_one_and_process_two)
+        function_uris = info.get_uri("function")
+        self.assertIs(info.get_uri("function"), function_uris)
+        self.assertIs(info.get_uri("arguments", "param_1"),
+                      info.get_uri("arguments", "param_1"))
+        self.assertIsNone(info.get_uri("arguments", "non_existent"))
+        self.assertIsNone(info.get_uri("arguments", "non_existent"))
+
     def test_invalid_object_annotations(self):
         obj = InputObject()
         info = _OntologyInformation(obj)
@@ -351,98 +419,78 @@ class OntologyAnnotationTestCase(unittest.TestCase):
 
         # Read PROV information as RDF
         prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        prov_graph.parse(data=prov_data, format='turtle')
 
         # Check that no other annotations are present
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         types = list(prov_graph.objects(execution_uri, RDF.type))
         self.assertListEqual(types, [ALPACA.FunctionExecution])
 
-    def test_provenance_annotation(self):
-        activate(clear=True)
-        input_object = InputObject()
-        output_object = process(input_object, 34)
-        deactivate()
-
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+    def test_provenance_annotation_types(self):
+        prov_graph, _ = self._get_prov_graph(process, 34)
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist (1 per class is expected)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Parameter)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessFunction)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedData)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.InputObject)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.OutputObject)))
-            ), 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.Parameter], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessFunction], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedData], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.InputObject], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.OutputObject], 1)
+
+    def test_provenance_annotation_execution(self):
+        prov_graph, prov_triples = self._get_prov_graph(process, 34)
 
         # FunctionExecution is ProcessFunction
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
-        self.assertTrue((execution_uri,
-                         RDF.type,
-                         self.ONTOLOGY.ProcessFunction) in prov_graph)
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
+        self.assertIn((execution_uri,
+                       RDF.type,
+                       self.ONTOLOGY.ProcessFunction), prov_triples)
 
         # Check parameter name
-        parameter_node = list(
-            prov_graph.subjects(RDF.type, self.ONTOLOGY.Parameter))[0]
-        self.assertTrue((parameter_node,
-                         ALPACA.pairName, Literal("param_1")) in prov_graph)
-        self.assertTrue((parameter_node,
-                         ALPACA.pairValue, Literal(34)) in prov_graph)
+        parameter_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.Parameter))
+        self.assertIn((parameter_node,
+                       ALPACA.pairName, Literal("param_1")), prov_triples)
+        self.assertIn((parameter_node,
+                       ALPACA.pairValue, Literal(34)), prov_triples)
+
+    def test_provenance_annotation_output(self):
+        prov_graph, prov_triples = self._get_prov_graph(process, 34)
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
 
         # Check returned value
-        output_node = list(
-            prov_graph.subjects(RDF.type, self.ONTOLOGY.ProcessedData))[0]
-        self.assertTrue((output_node,
-                         PROV.wasGeneratedBy, execution_uri) in prov_graph)
-        self.assertTrue((output_node,
-                         RDF.type, ALPACA.DataObjectEntity) in prov_graph)
-        self.assertTrue((output_node,
-                         RDF.type, self.ONTOLOGY.OutputObject) in prov_graph)
+        output_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.ProcessedData))
+        self.assertIn((output_node,
+                       PROV.wasGeneratedBy, execution_uri), prov_triples)
+        self.assertIn((output_node,
+                       RDF.type, ALPACA.DataObjectEntity), prov_triples)
+        self.assertIn((output_node,
+                       RDF.type, self.ONTOLOGY.OutputObject), prov_triples)
 
         # Check attributes of returned value
-        expected_attributes = {
-            'name': "SpikeTrain#1",
-            'channel': 45,
-        }
-        for attribute in prov_graph.objects(output_node, ALPACA.hasAttribute):
-            name = prov_graph.value(attribute, ALPACA.pairName).toPython()
-            value = prov_graph.value(attribute, ALPACA.pairValue).toPython()
-            self.assertEqual(value, expected_attributes[name])
+        self._check_output_attributes(prov_graph, output_node,
+                                      {'name': "SpikeTrain#1",
+                                       'channel': 45})
 
-            # Check if attribute annotation is present for `name`
-            if name == 'name':
-                self.assertTrue((attribute, RDF.type, self.ONTOLOGY.Attribute)
-                                in prov_graph)
+    def test_provenance_annotation_input_object(self):
+        prov_graph, prov_triples = self._get_prov_graph(process, 34)
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
+        output_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.ProcessedData))
 
         # Check input value
-        input_node = list(
-            prov_graph.subjects(RDF.type, self.ONTOLOGY.InputObject))[0]
-        self.assertTrue((execution_uri, PROV.used, input_node) in prov_graph)
-        self.assertTrue((input_node,
-                         RDF.type, ALPACA.DataObjectEntity) in prov_graph)
-        self.assertTrue((output_node,
-                         PROV.wasDerivedFrom, input_node) in prov_graph)
+        input_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.InputObject))
+        self.assertIn((execution_uri, PROV.used, input_node), prov_triples)
+        self.assertIn((input_node,
+                       RDF.type, ALPACA.DataObjectEntity), prov_triples)
+        self.assertIn((output_node,
+                       PROV.wasDerivedFrom, input_node), prov_triples)
 
     def test_provenance_multiple_annotations(self):
         activate(clear=True)
@@ -450,42 +498,21 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         output_object = process_one_and_process_two(input_object, 34)
         deactivate()
 
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        # Get PROV information as RDF graph, without serialization
+        prov_graph = Provenance.get_prov_info().graph
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist (1 per class is expected)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Parameter)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Process1Function)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Process2Function)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedData)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.InputObject)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.OutputObject)))
-            ), 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.Parameter], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.Process1Function], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.Process2Function], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedData], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.InputObject], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.OutputObject], 1)
 
         # FunctionExecution is ProcessFunction
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         self.assertTrue((execution_uri,
                          RDF.type,
                          self.ONTOLOGY.Process1Function) in prov_graph)
@@ -495,16 +522,16 @@ class OntologyAnnotationTestCase(unittest.TestCase):
                          self.ONTOLOGY.Process2Function) in prov_graph)
 
         # Check parameter name
-        parameter_node = list(
-            prov_graph.subjects(RDF.type, self.ONTOLOGY.Parameter))[0]
+        parameter_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.Parameter))
         self.assertTrue((parameter_node,
                          ALPACA.pairName, Literal("param_1")) in prov_graph)
         self.assertTrue((parameter_node,
                          ALPACA.pairValue, Literal(34)) in prov_graph)
 
         # Check returned value
-        output_node = list(
-            prov_graph.subjects(RDF.type, self.ONTOLOGY.ProcessedData))[0]
+        output_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.ProcessedData))
         self.assertTrue((output_node,
                          PROV.wasGeneratedBy, execution_uri) in prov_graph)
         self.assertTrue((output_node,
@@ -513,149 +540,110 @@ class OntologyAnnotationTestCase(unittest.TestCase):
                          RDF.type, self.ONTOLOGY.OutputObject) in prov_graph)
 
         # Check attributes of returned value
-        expected_attributes = {
-            'name': "SpikeTrain#1",
-            'channel': 45,
-        }
-        for attribute in prov_graph.objects(output_node, ALPACA.hasAttribute):
-            name = prov_graph.value(attribute, ALPACA.pairName).toPython()
-            value = prov_graph.value(attribute, ALPACA.pairValue).toPython()
-            self.assertEqual(value, expected_attributes[name])
-
-            # Check if attribute annotation is present for `name`
-            if name == 'name':
-                self.assertTrue((attribute, RDF.type, self.ONTOLOGY.Attribute)
-                                in prov_graph)
+        self._check_output_attributes(prov_graph, output_node,
+                                      {'name': "SpikeTrain#1",
+                                       'channel': 45})
 
         # Check input value
-        input_node = list(
-            prov_graph.subjects(RDF.type, self.ONTOLOGY.InputObject))[0]
+        input_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.InputObject))
         self.assertTrue((execution_uri, PROV.used, input_node) in prov_graph)
         self.assertTrue((input_node,
                          RDF.type, ALPACA.DataObjectEntity) in prov_graph)
         self.assertTrue((output_node,
                          PROV.wasDerivedFrom, input_node) in prov_graph)
 
-    def test_provenance_annotation_multiple_returns(self):
-        activate(clear=True)
-        input_object = InputObject()
-        name, output_object = process_multiple(input_object, 45)
-        deactivate()
-
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+    def test_provenance_annotation_multiple_returns_types(self):
+        prov_graph, _ = self._get_prov_graph(process_multiple, 45,
+                                             unpack_outputs=True)
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist (1 per class is expected. None
         # are expected for the classes of `process`)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Parameter)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessFunctionMultiple)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedDataMultiple)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.InputObject)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.OutputObject)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessFunction)))
-            ), 0)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedData)))
-            ), 0)
+        self.assertEqual(type_counts[self.ONTOLOGY.Parameter], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessFunctionMultiple], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedDataMultiple], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.InputObject], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.OutputObject], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessFunction], 0)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedData], 0)
+
+    def test_provenance_annotation_multiple_returns_execution(self):
+        prov_graph, prov_triples = self._get_prov_graph(
+            process_multiple, 45, unpack_outputs=True)
 
         # FunctionExecution is ProcessFunctionMultiple
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
-        self.assertTrue((execution_uri, RDF.type,
-                         self.ONTOLOGY.ProcessFunctionMultiple) in prov_graph)
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
+        self.assertIn((execution_uri, RDF.type,
+                       self.ONTOLOGY.ProcessFunctionMultiple), prov_triples)
 
         # Check parameter name
-        parameter_node = list(
-            prov_graph.subjects(RDF.type, self.ONTOLOGY.Parameter))[0]
-        self.assertTrue((parameter_node,
-                         ALPACA.pairName, Literal("param_1")) in prov_graph)
-        self.assertTrue((parameter_node,
-                         ALPACA.pairValue, Literal(45)) in prov_graph)
+        parameter_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.Parameter))
+        self.assertIn((parameter_node,
+                       ALPACA.pairName, Literal("param_1")), prov_triples)
+        self.assertIn((parameter_node,
+                       ALPACA.pairValue, Literal(45)), prov_triples)
+
+    def test_provenance_annotation_multiple_returns_output(self):
+        prov_graph, prov_triples = self._get_prov_graph(
+            process_multiple, 45, unpack_outputs=True)
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
 
         # Check returned value
-        output_node = list(
+        output_node = next(
             prov_graph.subjects(RDF.type,
-                                self.ONTOLOGY.ProcessedDataMultiple))[0]
-        self.assertTrue((output_node,
-                         PROV.wasGeneratedBy, execution_uri) in prov_graph)
-        self.assertTrue((output_node,
-                         RDF.type, ALPACA.DataObjectEntity) in prov_graph)
-        self.assertTrue((output_node,
-                         RDF.type, self.ONTOLOGY.OutputObject) in prov_graph)
+                                self.ONTOLOGY.ProcessedDataMultiple))
+        self.assertIn((output_node,
+                       PROV.wasGeneratedBy, execution_uri), prov_triples)
+        self.assertIn((output_node,
+                       RDF.type, ALPACA.DataObjectEntity), prov_triples)
+        self.assertIn((output_node,
+                       RDF.type, self.ONTOLOGY.OutputObject), prov_triples)
 
         # Check attributes of returned value
-        expected_attributes = {
-            'name': "SpikeTrain#2",
-            'channel': 34,
-        }
-        for attribute in prov_graph.objects(output_node, ALPACA.hasAttribute):
-            name = prov_graph.value(attribute, ALPACA.pairName).toPython()
-            value = prov_graph.value(attribute, ALPACA.pairValue).toPython()
-            self.assertEqual(value, expected_attributes[name])
-
-            # Check if attribute annotation is present for `name`
-            if name == 'name':
-                self.assertTrue((attribute, RDF.type, self.ONTOLOGY.Attribute)
-                                in prov_graph)
+        self._check_output_attributes(prov_graph, output_node,
+                                      {'name': "SpikeTrain#2",
+                                       'channel': 34})
+
+    def test_provenance_annotation_multiple_returns_input_object(self):
+        prov_graph, prov_triples = self._get_prov_graph(
+            process_multiple, 45, unpack_outputs=True)
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
+        output_node = next(
+            prov_graph.subjects(RDF.type,
+                                self.ONTOLOGY.ProcessedDataMultiple))
 
         # Check input value
-        input_node = list(
-            prov_graph.subjects(RDF.type, self.ONTOLOGY.InputObject))[0]
-        self.assertTrue((execution_uri,
-                         PROV.used, input_node) in prov_graph)
-        self.assertTrue((input_node,
-                         RDF.type, ALPACA.DataObjectEntity) in prov_graph)
-        self.assertTrue((output_node,
-                         PROV.wasDerivedFrom, input_node) in prov_graph)
+        input_node = next(
+            prov_graph.subjects(RDF.type, self.ONTOLOGY.InputObject))
+        self.assertIn((execution_uri,
+                       PROV.used, input_node), prov_triples)
+        self.assertIn((input_node,
+                       RDF.type, ALPACA.DataObjectEntity), prov_triples)
+        self.assertIn((output_node,
+                       PROV.wasDerivedFrom, input_node), prov_triples)
 
     def test_provenance_annotation_container_output(self):
         activate(clear=True)
         container = process_container_output()
         deactivate()
 
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        # Get PROV information as RDF graph, without serialization
+        prov_graph = Provenance.get_prov_info().graph
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist (1 per class is expected. None
         # are expected for the classes of `process`)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessContainerOutput)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedContainerOutput)))
-            ), 3)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessContainerOutput], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedContainerOutput], 3)
 
         # FunctionExecution is ProcessContainerOutput
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         self.assertTrue((execution_uri, RDF.type,
                          self.ONTOLOGY.ProcessContainerOutput) in prov_graph)
 
@@ -676,26 +664,17 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         container = process_multiple_container_output()
         deactivate()
 
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        # Get PROV information as RDF graph, without serialization
+        prov_graph = Provenance.get_prov_info().graph
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessMultipleContainerOutput)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutput)))
-            ), 9)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessMultipleContainerOutput], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutput], 9)
 
         # FunctionExecution is ProcessMultipleContainerOutput
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         self.assertTrue((execution_uri, RDF.type,
                          self.ONTOLOGY.ProcessMultipleContainerOutput) in prov_graph)
 
@@ -717,30 +696,18 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         container = process_multiple_container_output_multiple_annotations()
         deactivate()
 
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        # Get PROV information as RDF graph, without serialization
+        prov_graph = Provenance.get_prov_info().graph
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotations)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutputLevel2)))
-            ), 6)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutputLevel1)))
-            ), 2)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotations], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutputLevel2], 6)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutputLevel1], 2)
 
         # FunctionExecution is ProcessMultipleContainerOutputMultipleAnnotations
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         self.assertTrue((execution_uri, RDF.type,
                          self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotations) in prov_graph)
 
@@ -769,34 +736,19 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         container = process_multiple_container_output_multiple_annotations_root()
         deactivate()
 
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        # Get PROV information as RDF graph, without serialization
+        prov_graph = Provenance.get_prov_info().graph
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotationsRoot)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutputLevel2)))
-            ), 6)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutputLevel1)))
-            ), 2)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutputLevel0)))
-            ), 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotationsRoot], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutputLevel2], 6)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutputLevel1], 2)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutputLevel0], 1)
 
         # FunctionExecution is ProcessMultipleContainerOutputMultipleAnnotationsRoot
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         self.assertTrue((execution_uri, RDF.type,
                          self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotationsRoot) in prov_graph)
 
@@ -832,34 +784,19 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         container = process_multiple_container_output_multiple_annotations_range()
         deactivate()
 
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        # Get PROV information as RDF graph, without serialization
+        prov_graph = Provenance.get_prov_info().graph
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotationsRange)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutputLevel2)))
-            ), 6)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutputLevel1)))
-            ), 2)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessedMultipleContainerOutputLevel0)))
-            ), 0)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotationsRange], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutputLevel2], 6)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutputLevel1], 2)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessedMultipleContainerOutputLevel0], 0)
 
         # FunctionExecution is ProcessMultipleContainerOutputMultipleAnnotationsRange
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         self.assertTrue((execution_uri, RDF.type,
                          self.ONTOLOGY.ProcessMultipleContainerOutputMultipleAnnotationsRange) in prov_graph)
 
@@ -890,30 +827,18 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         result = process_input_annotation(5, 6)
         deactivate()
 
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        # Get PROV information as RDF graph, without serialization
+        prov_graph = Provenance.get_prov_info().graph
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessInputAnnotation)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Input)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Param)))
-            ), 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessInputAnnotation], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.Input], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.Param], 1)
 
         # FunctionExecution is ProcessInputAnnotation
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         self.assertTrue((execution_uri, RDF.type,
                          self.ONTOLOGY.ProcessInputAnnotation) in prov_graph)
 
@@ -933,34 +858,19 @@ class OntologyAnnotationTestCase(unittest.TestCase):
         result = process_container_input_annotation(5, input_list, 6)
         deactivate()
 
-        prov_data = save_provenance()
-
-        # Read PROV information as RDF
-        prov_graph = Graph()
-        with io.StringIO(prov_data) as data_stream:
-            prov_graph.parse(data_stream, format='turtle')
+        # Get PROV information as RDF graph, without serialization
+        prov_graph = Provenance.get_prov_info().graph
+        type_counts = _count_types(prov_graph)
 
         # Check that the annotations exist
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ProcessContainerInputAnnotation)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Input)))
-            ), 1)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.ContainerElementInput)))
-            ), 3)
-        self.assertEqual(
-            len(list(prov_graph.triples(
-                (None, RDF.type, self.ONTOLOGY.Param)))
-            ), 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ProcessContainerInputAnnotation], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.Input], 1)
+        self.assertEqual(type_counts[self.ONTOLOGY.ContainerElementInput], 3)
+        self.assertEqual(type_counts[self.ONTOLOGY.Param], 1)
 
         # FunctionExecution is ProcessContainerInputAnnotation
-        execution_uri = list(
-            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))[0]
+        execution_uri = next(
+            prov_graph.subjects(RDF.type, ALPACA.FunctionExecution))
         self.assertTrue((execution_uri, RDF.type,
                          self.ONTOLOGY.ProcessContainerInputAnnotation) in prov_graph)
 
@@ -1,9 +1,11 @@
 import unittest
 
+import os
+from functools import partial
 from pathlib import Path
 import tempfile
 import rdflib
-from rdflib.compare import graph_diff
+from rdflib.compare import graph_diff, to_isomorphic
 
 import numpy as np
 import quantities as pq
@@ -14,6 +16,7 @@ from alpaca.alpaca_types import (DataObject, File, FunctionInfo,
                                  Container)
 from alpaca import AlpacaProvDocument, alpaca_setting
 from alpaca.serialization.converters import _ensure_type
+from alpaca.serialization.terms import PROV_HAD_MEMBER, PROV_WAS_ATTRIBUTED_TO
 from alpaca.serialization.neo import _neo_to_prov
 
 # Define tuples of information as they would be captured by the decorator
@@ -74,6 +77,19 @@ TIMESTAMP_END = "2022-05-02T12:35:56.123456"
 SCRIPT_INFO = File("111111", "sha256", "/script.py")
 SCRIPT_SESSION_ID = "999999"
 
+# Builds FunctionExecution tuples of a single execution of `TEST_FUNCTION`.
+# Only the information that changes across the tests needs to be passed
+make_execution = partial(FunctionExecution,
+                         function=TEST_FUNCTION, call_ast=None, kwarg_map=[],
+                         return_targets=[], time_stamp_start=TIMESTAMP_START,
+                         time_stamp_end=TIMESTAMP_END, execution_id="12345",
+                         order=1)
+
+# Serialization formats that can be read back by Alpaca, and formats that
+# can only be written
+READ_FORMATS = ('json-ld', 'n3', 'nt', 'turtle', 'xml')
+WRITE_ONLY_FORMATS = ('hext', 'pretty-xml', 'trig', 'longturtle')
+
 
 def assert_rdf_graphs_equal(G1, G2):
     result = G1.isomorphic(G2)
@@ -83,6 +99,19 @@ def assert_rdf_graphs_equal(G1, G2):
     return result
 
 
+def graph_diff_message(G1, G2):
+    # Describes the triples that differ between the canonical forms of the
+    # graphs, to be used in the message of a failed comparison
+    _, in_first, in_second = graph_diff(G1, G2)
+    in_first = "\n".join(sorted(
+        " ".join(term.n3() for term in triple) for triple in in_first))
+    in_second = "\n".join(sorted(
+        " ".join(term.n3() for term in triple) for triple in in_second))
+    return (f"Graphs are not isomorphic.\n"
+            f"Only in first graph:\n{in_first}\n"
+            f"Only in second graph:\n{in_second}")
+
+
 class AlpacaProvSerializationTestCase(unittest.TestCase):
 
     @classmethod
@@ -90,6 +119,26 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
         cls.ttl_path = Path(__file__).parent / "res"
         alpaca_setting('authority', "fz-juelich.de")
 
+        # Parse each expected graph only once
+        cls.expected_graphs = {}
+        for name in ("values", "input_output", "metadata",
+                     "input_container", "class_method", "input_multiple",
+                     "collection", "file_output", "file_input"):
+            graph = rdflib.Graph()
+            graph.parse(data=(cls.ttl_path / f"{name}.ttl").read_bytes(),
+                        format='turtle')
+            cls.expected_graphs[name] = graph
+
+        # Digests of the canonical forms of the expected graphs
+        cls.expected_digests = {name: to_isomorphic(graph).graph_digest()
+                                for name, graph in cls.expected_graphs.items()}
+
+    def assertGraphEqualsExpected(self, graph, name):
+        # Compares the digests of the canonical forms of the graphs. The graph
+        # differences are computed only to describe a mismatch
+        if to_isomorphic(graph).graph_digest() != self.expected_digests[name]:
+            self.fail(graph_diff_message(graph, self.expected_graphs[name]))
+
     def setUp(self):
         alpaca_setting('store_values', [])
 
@@ -123,24 +172,15 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                           5432111, {},
                           str(dict(id=[1, 2, 3], value={4, 5, 6})))
 
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
-            input={'input_1': INPUT}, params={'param_1': 5},
+        function_execution = make_execution(
+            input={'input_1': INPUT},
+            params={'param_1': 5},
             output={0: OUTPUT, 1: INT, 2: FLOAT, 3: STR, 4: COMPLEX,
                     5: BOOL, 6: NUMPY_FLOAT32, 7: NUMPY_FLOAT64,
                     8: NUMPY_INT64, 9: NUMPY_INT32, 10: NUMPY_INT16,
                     11: DICT},
-            call_ast=None,
-            arg_map=['input_1', 'param_1'], kwarg_map=[], return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(input_1, 5)"
-        )
-
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "values.ttl"
-        expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
+            arg_map=['input_1', 'param_1'],
+            code_statement="test_function(input_1, 5)")
 
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
@@ -148,24 +188,15 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                                 history=[function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "values")
 
     def test_input_output_serialization(self):
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
-            input={'input_1': INPUT}, params={'param_1': 5},
-            output={0: OUTPUT}, call_ast=None,
-            arg_map=['input_1', 'param_1'], kwarg_map=[], return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(input_1, 5)"
-        )
-
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "input_output.ttl"
-        expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
+        function_execution = make_execution(
+            input={'input_1': INPUT},
+            params={'param_1': 5},
+            output={0: OUTPUT},
+            arg_map=['input_1', 'param_1'],
+            code_statement="test_function(input_1, 5)")
 
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
@@ -173,24 +204,15 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                                 history=[function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "input_output")
 
     def test_metadata_serialization(self):
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
-            input={'input_1': INPUT_METADATA}, params={'param_1': 5},
-            output={0: OUTPUT_METADATA_NEO}, call_ast=None,
-            arg_map=['input_1', 'param_1'], kwarg_map=[], return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(input_1, 5)"
-        )
-
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "metadata.ttl"
-        expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
+        function_execution = make_execution(
+            input={'input_1': INPUT_METADATA},
+            params={'param_1': 5},
+            output={0: OUTPUT_METADATA_NEO},
+            arg_map=['input_1', 'param_1'],
+            code_statement="test_function(input_1, 5)")
 
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
@@ -198,26 +220,15 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                                 history=[function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "metadata")
 
     def test_input_container_serialization(self):
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
+        function_execution = make_execution(
             input={'input_container': Container((INPUT, INPUT_2))},
             params={'param_1': 5},
-            output={0: OUTPUT}, call_ast=None,
-            arg_map=['input_container', 'param_1'], kwarg_map=[],
-            return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(input_container, 5)"
-        )
-
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "input_container.ttl"
-        expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
+            output={0: OUTPUT},
+            arg_map=['input_container', 'param_1'],
+            code_statement="test_function(input_container, 5)")
 
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
@@ -225,8 +236,7 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                                 history=[function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "input_container")
 
     def test_class_method_serialization(self):
         obj_info = DataObject(
@@ -236,49 +246,30 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
             id=232323,
             details={}, value=None)
 
-        function_execution = FunctionExecution(
+        function_execution = make_execution(
             function=FunctionInfo('ObjectWithMethod.process',
                                   'test', ''),
             input={'self': obj_info, 'array': INPUT},
             params={'param1': 4},
-            output={0: OUTPUT}, call_ast=None,
-            arg_map=['self', 'array', 'param1'], kwarg_map=[],
-            return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
+            output={0: OUTPUT},
+            arg_map=['self', 'array', 'param1'],
             code_statement="res = obj.process(INPUT, 4)")
 
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "class_method.ttl"
-        expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
-
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
         alpaca_prov.add_history(SCRIPT_INFO, SCRIPT_SESSION_ID,
                                 history=[function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "class_method")
 
     def test_input_multiple_serialization(self):
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
+        function_execution = make_execution(
             input={'input_1': INPUT, 'input_2': INPUT_2},
             params={'param_1': 5},
-            output={0: OUTPUT}, call_ast=None,
-            arg_map=['input_1', 'input_2', 'param_1'], kwarg_map=[],
-            return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(input_1, input_2, 5)"
-        )
-
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "input_multiple.ttl"
-        expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
+            output={0: OUTPUT},
+            arg_map=['input_1', 'input_2', 'param_1'],
+            code_statement="test_function(input_1, input_2, 5)")
 
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
@@ -286,8 +277,7 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                                 history=[function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "input_multiple")
 
     def test_collection_serialization(self):
         indexing_access = FunctionExecution(
@@ -298,20 +288,12 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
             time_stamp_end=TIMESTAMP_END, execution_id="888888", order=None,
             code_statement=None)
 
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
-            input={'input_1': INPUT}, params={'param_1': 5},
-            output={0: OUTPUT}, call_ast=None,
-            arg_map=['input_1', 'param_1'], kwarg_map=[], return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(source_list[0], 5)"
-        )
-
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "collection.ttl"
-        expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
+        function_execution = make_execution(
+            input={'input_1': INPUT},
+            params={'param_1': 5},
+            output={0: OUTPUT},
+            arg_map=['input_1', 'param_1'],
+            code_statement="test_function(source_list[0], 5)")
 
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
@@ -319,24 +301,78 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                                 history=[indexing_access, function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "collection")
+
+    def test_repeated_collection_serialization(self):
+        # Same subscript operation executed twice, e.g., inside a loop
+        indexing_accesses = [
+            FunctionExecution(
+                function=FunctionInfo(name='subscript', module="",
+                                      version=""),
+                input={0: COLLECTION}, params={'index': 0},
+                output={0: INPUT}, call_ast=None, arg_map=None,
+                kwarg_map=None, return_targets=[],
+                time_stamp_start=TIMESTAMP_START,
+                time_stamp_end=TIMESTAMP_END, execution_id=execution_id,
+                order=None, code_statement=None)
+            for execution_id in ("888888", "888889")
+        ]
+
+        function_execution = make_execution(
+            input={'input_1': INPUT},
+            params={'param_1': 5},
+            output={0: OUTPUT},
+            arg_map=['input_1', 'param_1'],
+            code_statement="test_function(source_list[0], 5)")
 
-    def test_file_output_serialization(self):
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
-            input={'input_1': INPUT}, params={'param_1': 5},
-            output={0: NONE_OUTPUT, 'file.0': OUTPUT_FILE}, call_ast=None,
-            arg_map=['input_1', 'param_1'], kwarg_map=[], return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(input_1, 5)"
-        )
+        # Serialize the history using AlpacaProv document
+        alpaca_prov = AlpacaProvDocument()
+        alpaca_prov.add_history(SCRIPT_INFO, SCRIPT_SESSION_ID,
+                                history=[*indexing_accesses,
+                                         function_execution])
 
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "file_output.ttl"
+        # Check if graphs are equal and the repeated record was skipped
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "collection")
+
+    def test_repeated_collection_two_sessions_serialization(self):
+        # Same subscript operation recorded by two scripts/sessions and added
+        # to a single document. The entities must be attributed to both
+        # script agents, as when the histories are serialized separately
+        indexing_access = FunctionExecution(
+            function=FunctionInfo(name='subscript', module="", version=""),
+            input={0: COLLECTION}, params={'index': 0},
+            output={0: INPUT}, call_ast=None, arg_map=None, kwarg_map=None,
+            return_targets=[], time_stamp_start=TIMESTAMP_START,
+            time_stamp_end=TIMESTAMP_END, execution_id="888888", order=None,
+            code_statement=None)
+        sessions = ((SCRIPT_INFO, "s1"),
+                    (File("222222", "sha256", "/script2.py"), "s2"))
+
+        alpaca_prov = AlpacaProvDocument()
         expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
+        for script_info, session_id in sessions:
+            alpaca_prov.add_history(script_info, session_id,
+                                    history=[indexing_access])
+
+            session_prov = AlpacaProvDocument()
+            session_prov.add_history(script_info, session_id,
+                                     history=[indexing_access])
+            expected_graph += session_prov.graph
+
+        collection_uri = next(alpaca_prov.graph.subjects(
+            PROV_HAD_MEMBER, None))
+        self.assertEqual(len(set(alpaca_prov.graph.objects(
+            collection_uri, PROV_WAS_ATTRIBUTED_TO))), 2)
+        if to_isomorphic(alpaca_prov.graph) != to_isomorphic(expected_graph):
+            self.fail(graph_diff_message(alpaca_prov.graph, expected_graph))
+
+    def test_file_output_serialization(self):
+        function_execution = make_execution(
+            input={'input_1': INPUT},
+            params={'param_1': 5},
+            output={0: NONE_OUTPUT, 'file.0': OUTPUT_FILE},
+            arg_map=['input_1', 'param_1'],
+            code_statement="test_function(input_1, 5)")
 
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
@@ -344,24 +380,15 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                                 history=[function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "file_output")
 
     def test_file_input_serialization(self):
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
-            input={'input_1': INPUT_FILE}, params={'param_1': 5},
-            output={0: OUTPUT}, call_ast=None,
-            arg_map=['input_1', 'param_1'], kwarg_map=[], return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(input_1, 5)"
-        )
-
-        # Load expected RDF graph
-        expected_graph_file = self.ttl_path / "file_input.ttl"
-        expected_graph = rdflib.Graph()
-        expected_graph.parse(expected_graph_file, format='turtle')
+        function_execution = make_execution(
+            input={'input_1': INPUT_FILE},
+            params={'param_1': 5},
+            output={0: OUTPUT},
+            arg_map=['input_1', 'param_1'],
+            code_statement="test_function(input_1, 5)")
 
         # Serialize the history using AlpacaProv document
         alpaca_prov = AlpacaProvDocument()
@@ -369,8 +396,7 @@ class AlpacaProvSerializationTestCase(unittest.TestCase):
                                 history=[function_execution])
 
         # Check if graphs are equal
-        self.assertTrue(assert_rdf_graphs_equal(alpaca_prov.graph,
-                                                expected_graph))
+        self.assertGraphEqualsExpected(alpaca_prov.graph, "file_input")
 
 
 class SerializationIOTestCase(unittest.TestCase):
@@ -379,15 +405,12 @@ class SerializationIOTestCase(unittest.TestCase):
         cls.ttl_path = Path(__file__).parent / "res"
         cls.temp_dir = tempfile.TemporaryDirectory(dir=cls.ttl_path,
                                                    suffix="tmp")
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
-            input={'input_1': INPUT}, params={'param_1': 5},
-            output={0: OUTPUT}, call_ast=None,
-            arg_map=['input_1'], kwarg_map=[], return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(input_1, 5)"
-        )
+        function_execution = make_execution(
+            input={'input_1': INPUT},
+            params={'param_1': 5},
+            output={0: OUTPUT},
+            arg_map=['input_1'],
+            code_statement="test_function(input_1, 5)")
 
         # Serialize the history using AlpacaProv document
         cls.alpaca_prov = AlpacaProvDocument()
@@ -395,38 +418,44 @@ class SerializationIOTestCase(unittest.TestCase):
                                     history=[function_execution])
         alpaca_setting('authority', "fz-juelich.de")
 
+        # Canonical form of the graph, computed once for all comparisons
+        cls.canonical_graph = to_isomorphic(cls.alpaca_prov.graph)
+
+    def assertGraphEqualsDocument(self, graph):
+        # Compares the canonical forms of the graphs. The graph differences
+        # are computed only to describe a mismatch
+        if to_isomorphic(graph) != self.canonical_graph:
+            self.fail(graph_diff_message(self.alpaca_prov.graph, graph))
+
     def test_serialization_deserialization(self):
+        temp_root = self.temp_dir.name
 
         # For every supported format, serialize to a temp file
-        for output_format in ('json-ld', 'n3', 'nt', 'hext', 'pretty-xml',
-                              'trig', 'turtle', 'longturtle', 'xml'):
+        for output_format in READ_FORMATS + WRITE_ONLY_FORMATS:
             with self.subTest(f"Serialization format",
                               output_format=output_format):
-                output_file = Path(
-                    self.temp_dir.name) / f"test.{output_format}"
+                output_file = os.path.join(temp_root, f"test.{output_format}")
                 self.alpaca_prov.serialize(output_file,
                                            file_format=output_format)
-                self.assertTrue(output_file.exists())
+                self.assertTrue(os.path.exists(output_file))
 
         # For every supported format with parsers, read the temp saved files
         # and check against the original graph.
-        # No parsers for: 'pretty-xml', 'longturtle', 'hext' and 'trig'
-        for read_format in ('json-ld', 'n3', 'nt', 'turtle', 'xml'):
+        for read_format in READ_FORMATS:
             with self.subTest(f"Deserialization format",
                               read_format=read_format):
-                input_file = Path(self.temp_dir.name) / f"test.{read_format}"
+                input_file = os.path.join(temp_root, f"test.{read_format}")
                 read_alpaca_prov = AlpacaProvDocument()
                 read_alpaca_prov.read_records(input_file, file_format=None)
-                self.assertTrue(assert_rdf_graphs_equal(self.alpaca_prov.graph,
-                                                        read_alpaca_prov.graph))
+                self.assertGraphEqualsDocument(read_alpaca_prov.graph)
 
         # Test unsupported formats
-        for wrong_format in ('pretty-xml', 'longturtle', 'hext', 'trig'):
+        for wrong_format in WRITE_ONLY_FORMATS:
             with self.subTest(f"Unsupported format",
                               wrong_format=wrong_format):
                 with self.assertRaises(ValueError):
-                    input_file = Path(
-                        self.temp_dir.name) / f"test.{wrong_format}"
+                    input_file = os.path.join(temp_root,
+                                              f"test.{wrong_format}")
                     read_alpaca_prov = AlpacaProvDocument()
                     read_alpaca_prov.read_records(input_file, file_format=None)
 
@@ -434,8 +463,7 @@ class SerializationIOTestCase(unittest.TestCase):
         input_ttl = self.ttl_path / "input_output.ttl"
         read_ttl = AlpacaProvDocument()
         read_ttl.read_records(input_ttl, file_format=None)
-        self.assertTrue(assert_rdf_graphs_equal(read_ttl.graph,
-                                                self.alpaca_prov.graph))
+        self.assertGraphEqualsDocument(read_ttl.graph)
 
     def test_no_format(self):
         no_ext = Path(self.temp_dir.name) / "no_ext"
@@ -552,16 +580,12 @@ class MultipleMembershipSerializationTestCase(unittest.TestCase):
             order=None,
             code_statement=None)
 
-        function_execution = FunctionExecution(
-            function=TEST_FUNCTION,
-            input={'input_1': INPUT}, params={'param_1': 5},
-            output={0: OUTPUT}, call_ast=None,
-            arg_map=['input_1', 'param_1'], kwarg_map=[],
-            return_targets=[],
-            time_stamp_start=TIMESTAMP_START, time_stamp_end=TIMESTAMP_END,
-            execution_id="12345", order=1,
-            code_statement="test_function(super_container.containers[0].inputs[1], 5)"
-        )
+        function_execution = make_execution(
+            input={'input_1': INPUT},
+            params={'param_1': 5},
+            output={0: OUTPUT},
+            arg_map=['input_1', 'param_1'],
+            code_statement="test_function(super_container.containers[0].inputs[1], 5)")
 
         # Load expected RDF graph
         expected_graph_file = self.ttl_path / "multiple_memberships.ttl"
@@ -1,4 +1,6 @@
 import unittest
+from importlib.util import find_spec
+from unittest.mock import patch
 
 from alpaca import alpaca_setting
 from alpaca.settings import _ALPACA_SETTINGS
@@ -17,8 +19,15 @@ class AlpacaSettingsTestCase(unittest.TestCase):
         self.assertListEqual(alpaca_setting(setting_name), ['test'])
         self.assertListEqual(_ALPACA_SETTINGS[setting_name], ['test'])
 
+        # Other collections are accepted
+        new_setting = alpaca_setting(setting_name, ('test', 'tuple'))
+        self.assertTupleEqual(new_setting, ('test', 'tuple'))
+
         # Test wrong type
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(
+                ValueError,
+                "^Setting 'use_builtin_hash_for_module' must be of type: "
+                "list, tuple, set, frozenset$"):
             alpaca_setting(setting_name, "test wrong type")
 
         # Restore value
@@ -36,14 +45,46 @@ class AlpacaSettingsTestCase(unittest.TestCase):
         self.assertEqual(alpaca_setting(setting_name), "test-authority")
         self.assertEqual(_ALPACA_SETTINGS[setting_name], "test-authority")
 
+        # Values that are choices of other settings are not restricted, even
+        # if the requirements of that choice are not available
+        with patch('alpaca.settings.find_spec', return_value=None):
+            self.assertEqual(alpaca_setting(setting_name, 'xxh128'),
+                             'xxh128')
+
         # Test wrong type
-        with self.assertRaises(ValueError):
+        with self.assertRaisesRegex(
+                ValueError, "^Setting 'authority' must be of type: str$"):
             alpaca_setting(setting_name, ["test wrong type"])
 
         # Restore value
         alpaca_setting(setting_name, cur_setting)
         self.assertEqual(_ALPACA_SETTINGS[setting_name], cur_setting)
 
+    def test_object_hash_algorithm(self):
+        setting_name = 'object_hash_algorithm'
+
+        cur_setting = alpaca_setting(setting_name)
+        self.assertEqual(cur_setting, 'sha1')
+
+        new_setting = alpaca_setting(setting_name, 'md5')
+        self.assertEqual(new_setting, 'md5')
+        self.assertEqual(_ALPACA_SETTINGS[setting_name], 'md5')
+
+        # Test invalid algorithm
+        with self.assertRaises(ValueError):
+            alpaca_setting(setting_name, 'sha256')
+
+        # xxHash is accepted only if the package is available
+        if find_spec('xxhash') is not None:
+            self.assertEqual(alpaca_setting(setting_name, 'xxh128'), 'xxh128')
+        else:
+            with self.assertRaises(ValueError):
+                alpaca_setting(setting_name, 'xxh128')
+
+        # Restore value
+        alpaca_setting(setting_name, cur_setting)
+        self.assertEqual(_ALPACA_SETTINGS[setting_name], cur_setting)
+
     def test_wrong_setting_name(self):
         with self.assertRaises(ValueError):
             alpaca_setting("wrong_setting")
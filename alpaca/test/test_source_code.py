@@ -1,4 +1,4 @@
-import unittest
+import unittest.mock
 
 import inspect
 from functools import wraps
@@ -295,6 +295,27 @@ class CodeAnalyzerWithBlocksTestCase(unittest.TestCase):
                     expected_statement
                 )
 
+    def test_repeated_line_queries(self):
+
+        def main():
+            activate()
+
+            for _ in range(3):
+                res1 = function_call(arg11, arg12)
+
+        main()
+        source_code = Class.source_code
+        line = inspect.getsourcelines(main)[1] + 4
+
+        with unittest.mock.patch.object(
+                source_code, '_find_statement',
+                wraps=source_code._find_statement) as find_mock:
+            statements = [source_code.extract_multiline_statement(line)
+                          for _ in range(3)]
+
+        self.assertEqual(statements, [RES1] * 3)
+        find_mock.assert_called_once_with(line)
+
 
 if __name__ == "__main__":
     unittest.main()
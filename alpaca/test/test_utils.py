@@ -3,6 +3,7 @@ import unittest
 from alpaca.utils.files import _get_prov_file_format, _get_file_format
 from alpaca.utils import get_file_name
 from os.path import expanduser
+from pathlib import Path
 
 
 USER_PATH = expanduser("~")
@@ -77,6 +78,21 @@ class FileUtilsTestCase(unittest.TestCase):
         new_path = get_file_name(source_path, None, None)
         self.assertEqual(new_path, "/home/test.py")
 
+    def test_get_file_name_no_change_matches_full_path(self):
+        # With no changes requested, the name is only expanded. The result
+        # must be the same as when going through all the path operations,
+        # which happens with an empty suffix
+        cwd = Path.cwd().resolve()
+        for source_path, expected in (
+                ("data/../test.py", str(cwd / "test.py")),
+                ("test.py", str(cwd / "test.py")),
+                ("~/data/../test.py", USER_PATH + "/test.py")):
+            with self.subTest(source_path=source_path):
+                new_path = get_file_name(source_path)
+                self.assertEqual(new_path, expected)
+                self.assertEqual(new_path,
+                                 get_file_name(source_path, suffix=""))
+
     def test_get_prov_file_format_invalid(self):
         file_name = "/test_file"
         self.assertIsNone(_get_prov_file_format(file_name))
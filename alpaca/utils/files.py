@@ -5,6 +5,7 @@ This module contains utility functions to work with file names and extensions.
 
 """
 
+import os.path
 from pathlib import Path
 
 
@@ -47,6 +48,10 @@ def get_file_name(source, output_dir=None, extension=None, suffix=None):
         and `extension` are None, the result will be equal to `source`. The
         result path is absolute, with user and relative paths expanded.
     """
+    if output_dir is None and extension is None and suffix is None:
+        # Nothing to change in the name, only expand the path
+        return os.path.realpath(os.path.expanduser(source))
+
     if not isinstance(source, Path):
         source = Path(source)
 
@@ -70,14 +75,10 @@ def get_file_name(source, output_dir=None, extension=None, suffix=None):
 def _get_file_format(file_name):
     # Returns a string describing the file format based on the extension in
     # `file_name`. Returns None if no extension.
-    file_location = Path(file_name)
-
-    extension = file_location.suffix
-    if not extension.startswith('.'):
+    extension = os.path.splitext(file_name)[1]
+    if len(extension) < 2:
         return None
-    file_format = extension[1:]
-
-    return file_format
+    return extension[1:]
 
 
 def _get_prov_file_format(file_name):
@@ -88,8 +89,4 @@ def _get_prov_file_format(file_name):
     # RDFLib serialization format strings. Returns None if no extension.
 
     file_format = _get_file_format(file_name)
-
-    if file_format and file_format in RDF_FILE_FORMAT_MAP:
-        return RDF_FILE_FORMAT_MAP[file_format]
-
-    return file_format
+    return RDF_FILE_FORMAT_MAP.get(file_format, file_format)
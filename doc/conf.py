@@ -7,6 +7,7 @@
 import os
 import sys
 from datetime import date
+from pathlib import Path
 
 
 # -- Path setup --------------------------------------------------------------
@@ -28,10 +29,9 @@ copyright = u"2022-{this_year}, Forschungszentrum Jülich GmbH, INM-6, IAS-6."\
 # The version info for the project you're documenting, acts as replacement for
 # |version| and |release|, also used in various other places throughout the
 # built documents.
-root_dir = os.path.dirname(os.path.dirname(__file__))
-with open(os.path.join(root_dir, 'alpaca', 'VERSION')) as version_file:
-    # The full version, including alpha/beta/rc tags.
-    release = version_file.read().strip()
+# The full version, including alpha/beta/rc tags.
+version_file = Path(__file__).parents[1] / 'alpaca' / 'VERSION'
+release = version_file.read_text().strip()
 
 # The short X.Y version.
 version = '.'.join(release.split('.')[:-1])
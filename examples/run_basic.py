@@ -74,8 +74,18 @@ def isi_histogram(isi_times, bin_size=2*pq.ms, max_time=500*pq.ms):
     else:
         raise TypeError("ISI is not `pq.Quantity` or `np.ndarray`!")
 
-    counts, edges = np.histogram(times, bins=edges)
-    return counts, (edges * bin_size.units)
+    # The bins have uniform width. The bin of each ISI is obtained directly
+    # from its value, instead of searching the edges as in `np.histogram`.
+    # Floating-point division may place values close to an edge in the
+    # neighbouring bin, so the index is corrected by comparing with the
+    # edges. As in `np.histogram`, the last bin also includes its right edge
+    n_bins = len(edges) - 1
+    times = times[(times >= edges[0]) & (times <= edges[-1])]
+    bin_index = np.clip((times // step).astype(np.intp), 0, n_bins - 1)
+    bin_index -= times < edges[bin_index]
+    bin_index += (times >= edges[bin_index + 1]) & (bin_index < n_bins - 1)
+    counts = np.bincount(bin_index, minlength=n_bins)
+    return counts, pq.Quantity(edges, units=bin_size.units)
 
 
 @Provenance(inputs=['counts', 'edges'], file_output=['plot_file'])
@@ -88,6 +98,7 @@ def plot_isi_histogram(plot_file, counts, edges, title=None):
     if title is not None:
         ax.set_title(title)
     fig.savefig(plot_file)
+    plt.close(fig)
 
 
 def main(session_filename):
@@ -3,13 +3,13 @@ import os
 from setuptools import setup
 
 with open(os.path.join(os.path.dirname(__file__),
-                       "alpaca", "VERSION")) as version_file:
+                       "alpaca", "VERSION"), encoding='utf-8') as version_file:
     version = version_file.read().strip()
 
-with open("README.md") as f:
+with open("README.md", encoding='utf-8') as f:
     long_description = f.read()
 
-with open('requirements/requirements.txt') as fp:
+with open('requirements/requirements.txt', encoding='utf-8') as fp:
     install_requires = fp.read()
 
 
@@ -20,6 +20,7 @@ setup(
               'alpaca.ontology', 'alpaca.code_analysis'],
     include_package_data=True,
     install_requires=install_requires,
+    extras_require={'xxhash': ['xxhash']},
     author="Alpaca authors and contributors",
     author_email="",
     description="Alpaca is a Python package for the capture of provenance "